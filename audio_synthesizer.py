@@ -5,31 +5,102 @@ This module handles the conversion of text scripts to audio using Google's
 multi-speaker API for ASMR daddy content.
 """
 
+import asyncio
 import base64
+import collections
+import concurrent.futures
+import hashlib
+import logging
 import mimetypes
 import os
 import re
+import shutil
 import struct
-from google import genai
+import tempfile
+import threading
+import weakref
 from google.genai import types
 from google.api_core import exceptions as google_exceptions
+from gemini_client import get_async_client, get_client
+
+
+logger = logging.getLogger(__name__)
+
+# Default text prepended to scripts to guide the TTS model's tone
+DEFAULT_INSTRUCTIVE_PREFIX = "Read aloud in a natural, engaging tone, following the speaker cues and any emotional or contextual notes provided in the script:\n\n"
+
+# Canonical PCM WAV header layout (http://soundfile.sapp.org/doc/WaveFormat/),
+# compiled once so packing a header doesn't re-parse the format string
+_WAV_HEADER_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_UINT32_STRUCT = struct.Struct("<I")
+
+# Size in bytes of the canonical PCM WAV header produced by _wav_header
+WAV_HEADER_SIZE = _WAV_HEADER_STRUCT.size
+
+# Fast path for the raw PCM mime types the Gemini TTS models actually return:
+# maps mime type -> (file extension, WAV parameters) without touching the mimetypes database
+_FAST_MIME = {
+    "audio/L16;codec=pcm;rate=24000": (".wav", {"bits_per_sample": 16, "rate": 24000}),
+    "audio/L16;rate=24000": (".wav", {"bits_per_sample": 16, "rate": 24000}),
+    "audio/L16;codec=pcm;rate=16000": (".wav", {"bits_per_sample": 16, "rate": 16000}),
+    "audio/L16;rate=16000": (".wav", {"bits_per_sample": 16, "rate": 16000}),
+}
+
+# Maximum number of TTS requests a synthesizer keeps in flight at once
+MAX_BATCH_WORKERS = 8
+
+# Suggested max_segment_chars for long scripts: segments of at most this many characters
+# (at line boundaries) are synthesized concurrently and joined into one audio file
+SEGMENT_MAX_CHARS = 1000
+
+# Default location of the synthesized audio cache, and the total size it is trimmed to
+# (least recently used files are removed first)
+DEFAULT_AUDIO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "auto_daddy", "tts")
+AUDIO_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Write buffer size for audio output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Flush file data without forcing a separate inode timestamp update, where the platform allows it
+_sync_file_data = getattr(os, "fdatasync", os.fsync)
 
 
 class AudioSynthesizer:
     """Class for synthesizing audio from ASMR daddy scripts using Google's multi-speaker API."""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_dir=None):
         """
         Initialize the audio synthesizer.
         
         Args:
             api_key (str, optional): Google Gemini API key. If None, will try to get from environment.
+            cache_dir (str, optional): Directory for cached synthesis results. If None, uses
+                                       DEFAULT_AUDIO_CACHE_DIR.
         """
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required. Set GEMINI_API_KEY environment variable or pass as parameter.")
         
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_client(self.api_key)
+        
+        # On-disk cache of synthesized audio, keyed by a hash of the request
+        # (the directory is only created once something is stored)
+        self._cache_dir = cache_dir or DEFAULT_AUDIO_CACHE_DIR
+        
+        # Speech configs keyed by (speaker1_name, speaker1_voice, speaker2_name, speaker2_voice)
+        self._config_cache = {}
+        
+        # Bounds in-flight sync TTS requests across all batch workers and segment pools
+        self._request_slots = threading.BoundedSemaphore(MAX_BATCH_WORKERS)
+        
+        # Semaphores bounding in-flight async TTS requests, one per event loop
+        # (an asyncio.Semaphore can only be used from the loop it first waits on)
+        self._async_request_slots = weakref.WeakKeyDictionary()
+        
+        # WAV header for the common mono 16-bit 24 kHz case; only the two size fields vary per file
+        self._wav_header_template_24k16 = _WAV_HEADER_STRUCT.pack(
+            b"RIFF", 0, b"WAVE", b"fmt ", 16, 1, 1, 24000, 48000, 2, 16, b"data", 0
+        )
         
         # Default voice configurations
         self.default_voice = "Enceladus"  # Warm, comforting voice suitable for "daddy" ASMR
@@ -66,7 +137,7 @@ class AudioSynthesizer:
             "Sulafar"     # Warm
         ]
     
-    def synthesize_audio(self, script, output_file, model_name, speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", instructive_prefix="Read aloud in a natural, engaging tone, following the speaker cues and any emotional or contextual notes provided in the script:\n\n"):
+    def synthesize_audio(self, script, output_file, model_name, speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX, use_cache=False, max_segment_chars=None):
         """
         Synthesize audio from the provided script for two speakers.
         
@@ -79,6 +150,11 @@ class AudioSynthesizer:
             speaker2_name (str): Name/identifier for Speaker 2 in the script
             speaker2_voice (str): Voice to use for Speaker 2
             instructive_prefix (str): Text to prepend to the script to guide TTS model tone.
+            use_cache (bool): Reuse audio previously synthesized for an identical request instead of
+                              producing a new take. Off by default, since synthesis is not deterministic.
+            max_segment_chars (int, optional): Split scripts longer than this (e.g. SEGMENT_MAX_CHARS) into
+                                               segments synthesized concurrently. If None, the whole script
+                                               is synthesized in one request, which keeps its delivery consistent.
             
         Returns:
             str: Path to the saved audio file or error message
@@ -86,6 +162,207 @@ class AudioSynthesizer:
         if not script:
             return "Error: Empty script provided"
         
+        cache_path = None
+        if use_cache:
+            cache_path = self._cache_path(
+                script, model_name, speaker1_name, speaker1_voice, speaker2_name, speaker2_voice, instructive_prefix
+            )
+            cached_file = self._load_cached(cache_path, output_file)
+            if cached_file:
+                return cached_file
+        
+        try:
+            generate_content_config = self._resolve_speech_config(
+                speaker1_name, speaker1_voice, speaker2_name, speaker2_voice
+            )
+            segments = self._segment_script(script, max_segment_chars)
+            
+            saved_file = self._write_audio(segments, output_file, model_name, generate_content_config, instructive_prefix)
+            if saved_file:
+                if cache_path:
+                    self._store_cached(saved_file, cache_path)
+                return saved_file
+            else:
+                return "Error: No audio data generated"
+
+        except google_exceptions.InvalidArgument as e:
+            return f"API Invalid Argument error synthesizing audio ({type(e).__name__}): {str(e)}"
+        except google_exceptions.GoogleAPIError as e:
+            return f"Google API Error synthesizing audio ({type(e).__name__}): {str(e)}"
+        except Exception as e:
+            return f"Unexpected error synthesizing audio ({type(e).__name__}): {str(e)}"
+    
+    async def synthesize_audio_async(self, script, output_file, model_name, speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX, use_cache=False, max_segment_chars=None):
+        """
+        Asynchronously synthesize audio from the provided script for two speakers.
+        
+        Uses the client's asyncio interface, so several syntheses can be awaited
+        concurrently (e.g. with asyncio.gather) over the same client. File I/O (cache
+        copies, chunk writes and the final sync) runs in the loop's default executor.
+        
+        Args:
+            script (str): The script text with speaker annotations (e.g., "Speaker1:", "Speaker2:")
+            output_file (str): Path to save the output audio file
+            model_name (str): Name of the TTS model to use, like 'gemini-2.5-pro-preview-tts' or 'gemini-2.5-flash-preview-tts'.
+            speaker1_name (str): Name/identifier for Speaker 1 in the script
+            speaker1_voice (str): Voice to use for Speaker 1
+            speaker2_name (str): Name/identifier for Speaker 2 in the script
+            speaker2_voice (str): Voice to use for Speaker 2
+            instructive_prefix (str): Text to prepend to the script to guide TTS model tone.
+            use_cache (bool): Reuse audio previously synthesized for an identical request instead of
+                              producing a new take. Off by default, since synthesis is not deterministic.
+            max_segment_chars (int, optional): Split scripts longer than this (e.g. SEGMENT_MAX_CHARS) into
+                                               segments synthesized concurrently. If None, the whole script
+                                               is synthesized in one request, which keeps its delivery consistent.
+            
+        Returns:
+            str: Path to the saved audio file or error message
+        """
+        if not script:
+            return "Error: Empty script provided"
+        
+        # Every file operation below can block on disk I/O, so it runs in the default
+        # executor rather than on the event loop
+        loop = asyncio.get_running_loop()
+        
+        cache_path = None
+        if use_cache:
+            cache_path = self._cache_path(
+                script, model_name, speaker1_name, speaker1_voice, speaker2_name, speaker2_voice, instructive_prefix
+            )
+            cached_file = await loop.run_in_executor(None, self._load_cached, cache_path, output_file)
+            if cached_file:
+                return cached_file
+        
+        try:
+            generate_content_config = self._resolve_speech_config(
+                speaker1_name, speaker1_voice, speaker2_name, speaker2_voice
+            )
+            segments = self._segment_script(script, max_segment_chars)
+            
+            # Generate the audio content, writing each chunk to disk as it arrives. Writes are
+            # awaited one at a time, so the chunks still reach the file in order.
+            writer = _AudioFileWriter(self, output_file)
+            try:
+                async for inline_data in self._stream_audio_async(segments, model_name, generate_content_config, instructive_prefix):
+                    await loop.run_in_executor(None, writer.write, inline_data)
+            except BaseException:
+                await loop.run_in_executor(None, writer.discard)
+                raise
+            has_audio = await loop.run_in_executor(None, writer.close)
+            
+            if has_audio:
+                logger.info("File saved to: %s", writer.output_file)
+                if cache_path:
+                    await loop.run_in_executor(None, self._store_cached, writer.output_file, cache_path)
+                return writer.output_file
+            else:
+                return "Error: No audio data generated"
+
+        except google_exceptions.InvalidArgument as e:
+            return f"API Invalid Argument error synthesizing audio ({type(e).__name__}): {str(e)}"
+        except google_exceptions.GoogleAPIError as e:
+            return f"Google API Error synthesizing audio ({type(e).__name__}): {str(e)}"
+        except Exception as e:
+            return f"Unexpected error synthesizing audio ({type(e).__name__}): {str(e)}"
+    
+    def synthesize_audio_stream(self, script_lines, output_file, model_name, speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX):
+        """
+        Synthesize audio from script lines while they are still being produced.
+        
+        Lines are grouped into segments as they arrive and each segment is sent for
+        synthesis immediately, so audio generation overlaps with whatever is producing
+        the script (e.g. GeminiTextGenerator.stream_script).
+        
+        Args:
+            script_lines (iterable of str): Script lines, in order
+            output_file (str): Path to save the output audio file
+            model_name (str): Name of the TTS model to use
+            speaker1_name (str): Name/identifier for Speaker 1 in the script
+            speaker1_voice (str): Voice to use for Speaker 1
+            speaker2_name (str): Name/identifier for Speaker 2 in the script
+            speaker2_voice (str): Voice to use for Speaker 2
+            instructive_prefix (str): Text to prepend to each segment to guide TTS model tone.
+            
+        Returns:
+            str: Path to the saved audio file or error message
+        """
+        try:
+            generate_content_config = self._resolve_speech_config(
+                speaker1_name, speaker1_voice, speaker2_name, speaker2_voice
+            )
+            segments = self._group_lines(script_lines)
+            
+            saved_file = self._write_audio(segments, output_file, model_name, generate_content_config, instructive_prefix)
+            if saved_file:
+                return saved_file
+            else:
+                return "Error: No audio data generated"
+
+        except google_exceptions.InvalidArgument as e:
+            return f"API Invalid Argument error synthesizing audio ({type(e).__name__}): {str(e)}"
+        except google_exceptions.GoogleAPIError as e:
+            return f"Google API Error synthesizing audio ({type(e).__name__}): {str(e)}"
+        except Exception as e:
+            return f"Unexpected error synthesizing audio ({type(e).__name__}): {str(e)}"
+    
+    def synthesize_audio_batch(self, scripts, output_files, model_name, speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX, max_segment_chars=None):
+        """
+        Synthesize audio for several scripts concurrently, sharing one voice configuration.
+        
+        Requests are pipelined across a bounded thread pool, so the wall-clock time for
+        many short scripts is close to that of the slowest request rather than their sum.
+        
+        Args:
+            scripts (list[str]): The script texts to synthesize
+            output_files (list[str]): Output path for each script, in the same order
+            model_name (str): Name of the TTS model to use
+            speaker1_name (str): Name/identifier for Speaker 1 in the scripts
+            speaker1_voice (str): Voice to use for Speaker 1
+            speaker2_name (str): Name/identifier for Speaker 2 in the scripts
+            speaker2_voice (str): Voice to use for Speaker 2
+            instructive_prefix (str): Text to prepend to each script to guide TTS model tone.
+            max_segment_chars (int, optional): Split scripts longer than this into concurrently
+                                               synthesized segments. If None, each script is one request.
+            
+        Returns:
+            list[str]: Path to the saved audio file or error message for each script, in input order
+        """
+        if len(scripts) != len(output_files):
+            raise ValueError("scripts and output_files must have the same length.")
+        if not scripts:
+            return []
+        
+        def synthesize(script, output_file):
+            return self.synthesize_audio(
+                script,
+                output_file,
+                model_name,
+                speaker1_name=speaker1_name,
+                speaker1_voice=speaker1_voice,
+                speaker2_name=speaker2_name,
+                speaker2_voice=speaker2_voice,
+                instructive_prefix=instructive_prefix,
+                max_segment_chars=max_segment_chars
+            )
+        
+        max_workers = min(MAX_BATCH_WORKERS, len(scripts))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(synthesize, scripts, output_files))
+    
+    def _resolve_speech_config(self, speaker1_name, speaker1_voice, speaker2_name, speaker2_voice):
+        """
+        Validate the requested voices and get the matching generation config.
+        
+        Args:
+            speaker1_name (str): Name/identifier for Speaker 1 in the script
+            speaker1_voice (str): Voice to use for Speaker 1
+            speaker2_name (str): Name/identifier for Speaker 2 in the script
+            speaker2_voice (str): Voice to use for Speaker 2
+            
+        Returns:
+            types.GenerateContentConfig: Config for the speech generation request
+        """
         # Ensure speaker1_voice and speaker2_voice are valid, or use defaults
         s1_voice = speaker1_voice if speaker1_voice in self.available_voices else self.default_voice
         s2_voice = speaker2_voice if speaker2_voice in self.available_voices else self.default_voice # Or a different default like Puck
@@ -93,7 +370,348 @@ class AudioSynthesizer:
              available_defaults = [v for v in self.available_voices if v != s1_voice]
              s2_voice = available_defaults[0] if available_defaults else s1_voice # fallback to s1_voice if no other default
 
+        return self._get_speech_config(speaker1_name, s1_voice, speaker2_name, s2_voice)
+    
+    def _build_contents(self, script, instructive_prefix):
+        """
+        Build the request contents for a script.
+        
+        Args:
+            script (str): The script text with speaker annotations
+            instructive_prefix (str): Text to prepend to the script to guide TTS model tone.
+            
+        Returns:
+            list: List of types.Content for the request
+        """
+        # Prepend an instructive phrase to guide the TTS model's tone and adherence to script cues.
+        # The prefix goes in its own part so the (possibly long) script is never copied to join them.
+        parts = [types.Part.from_text(text=script)]
+        if instructive_prefix:
+            parts.insert(0, types.Part.from_text(text=instructive_prefix))
+        return [
+            types.Content(
+                role="user",
+                parts=parts,
+            ),
+        ]
+    
+    def _segment_script(self, script, max_chars=None):
+        """
+        Split a long script into segments at line boundaries.
+        
+        Args:
+            script (str): The script text
+            max_chars (int, optional): Target maximum segment length in characters. If None, the
+                                       script is not split.
+            
+        Returns:
+            list[str]: The script segments, in order (just [script] if it is short enough)
+        """
+        if max_chars is None or len(script) <= max_chars:
+            return [script]
+        return list(self._group_lines(script.splitlines(), max_chars))
+    
+    def _group_lines(self, lines, max_chars=SEGMENT_MAX_CHARS):
+        """
+        Group script lines into segments, yielding each segment as soon as it is complete.
+        
+        Lines are kept whole so every speaker cue stays with its dialogue; consecutive
+        lines are grouped until a segment would exceed max_chars.
+        
+        Args:
+            lines (iterable of str): Script lines, in order
+            max_chars (int): Target maximum segment length in characters
+            
+        Yields:
+            str: The script segments, in order
+        """
+        current = []
+        current_len = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            if current and current_len + len(line) > max_chars:
+                yield "\n".join(current)
+                current = []
+                current_len = 0
+            current.append(line)
+            current_len += len(line) + 1
+        if current:
+            yield "\n".join(current)
+    
+    def _write_audio(self, segments, output_file, model_name, generate_content_config, instructive_prefix):
+        """
+        Synthesize script segments and write the audio to a single file as it arrives.
+        
+        Args:
+            segments (iterable of str): Script segments, in order
+            output_file (str): Requested output path
+            model_name (str): Name of the TTS model to use
+            generate_content_config (types.GenerateContentConfig): Config for the requests
+            instructive_prefix (str): Text to prepend to each segment to guide TTS model tone.
+            
+        Returns:
+            str: Path to the saved audio file, or None if no audio was generated
+        """
+        writer = _AudioFileWriter(self, output_file)
         try:
+            for inline_data in self._stream_audio(segments, model_name, generate_content_config, instructive_prefix):
+                writer.write(inline_data)
+        except BaseException:
+            writer.discard()
+            raise
+        if not writer.close():
+            return None
+        logger.info("File saved to: %s", writer.output_file)
+        return writer.output_file
+    
+    def _stream_audio(self, segments, model_name, generate_content_config, instructive_prefix):
+        """
+        Yield the audio payloads for a script's segments, in order.
+        
+        A single segment is streamed straight through. Otherwise each segment is sent for
+        synthesis as soon as it is available (segments may be a lazy iterable), requests
+        run concurrently, and each segment's audio is yielded once it and all earlier
+        segments are complete. Every request holds one of the synthesizer's shared request
+        slots, so nested batch and segment pools never exceed MAX_BATCH_WORKERS requests.
+        
+        Args:
+            segments (iterable of str): Script segments, in order
+            model_name (str): Name of the TTS model to use
+            generate_content_config (types.GenerateContentConfig): Config for the requests
+            instructive_prefix (str): Text to prepend to each segment to guide TTS model tone.
+            
+        Yields:
+            The inline_data of each audio chunk
+        """
+        def stream_segment(segment):
+            with self._request_slots:
+                for chunk in self.client.models.generate_content_stream(
+                    model=model_name,
+                    contents=self._build_contents(segment, instructive_prefix),
+                    config=generate_content_config,
+                ):
+                    inline_data = self._chunk_inline_data(chunk)
+                    if inline_data:
+                        yield inline_data
+        
+        if isinstance(segments, list) and len(segments) == 1:
+            yield from stream_segment(segments[0])
+            return
+        
+        def collect_segment(segment):
+            return list(stream_segment(segment))
+        
+        pending = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS) as executor:
+            try:
+                for segment in segments:
+                    pending.append(executor.submit(collect_segment, segment))
+                    # Hand over any leading segments that have already finished
+                    while pending and pending[0].done():
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    async def _stream_audio_async(self, segments, model_name, generate_content_config, instructive_prefix):
+        """
+        Asynchronously yield the audio payloads for a script's segments, in order.
+        
+        All segment requests are started together, but at most MAX_BATCH_WORKERS requests
+        from this synthesizer (across all concurrent syntheses) stream at any one time.
+        
+        Args:
+            segments (list[str]): Script segments, in order
+            model_name (str): Name of the TTS model to use
+            generate_content_config (types.GenerateContentConfig): Config for the requests
+            instructive_prefix (str): Text to prepend to each segment to guide TTS model tone.
+            
+        Yields:
+            The inline_data of each audio chunk
+        """
+        request_slots = self._get_async_request_slots()
+        
+        async def stream_segment(segment):
+            async with request_slots:
+                async for chunk in await get_async_client(self.api_key).models.generate_content_stream(
+                    model=model_name,
+                    contents=self._build_contents(segment, instructive_prefix),
+                    config=generate_content_config,
+                ):
+                    inline_data = self._chunk_inline_data(chunk)
+                    if inline_data:
+                        yield inline_data
+        
+        if len(segments) == 1:
+            async for inline_data in stream_segment(segments[0]):
+                yield inline_data
+            return
+        
+        async def collect_segment(segment):
+            return [inline_data async for inline_data in stream_segment(segment)]
+        
+        tasks = [asyncio.ensure_future(collect_segment(segment)) for segment in segments]
+        try:
+            for task in tasks:
+                for inline_data in await task:
+                    yield inline_data
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _get_async_request_slots(self):
+        """
+        Get the semaphore that bounds this synthesizer's TTS requests on the running event loop.
+        
+        Returns:
+            asyncio.Semaphore: Semaphore allowing MAX_BATCH_WORKERS requests at once
+        """
+        loop = asyncio.get_running_loop()
+        request_slots = self._async_request_slots.get(loop)
+        if request_slots is None:
+            request_slots = self._async_request_slots[loop] = asyncio.Semaphore(MAX_BATCH_WORKERS)
+        return request_slots
+    
+    def _chunk_inline_data(self, chunk):
+        """
+        Extract the audio payload from a streamed response chunk.
+        
+        Args:
+            chunk: A response chunk from generate_content_stream
+            
+        Returns:
+            The chunk's inline_data, or None if it carries no audio
+        """
+        if (
+            chunk.candidates is None
+            or chunk.candidates[0].content is None
+            or chunk.candidates[0].content.parts is None
+        ):
+            return None
+        return chunk.candidates[0].content.parts[0].inline_data
+    
+    def _cache_path(self, script, model_name, speaker1_name, speaker1_voice, speaker2_name, speaker2_voice, instructive_prefix):
+        """
+        Get the cache file path for a synthesis request.
+        
+        Args:
+            script (str): The script text
+            model_name (str): Name of the TTS model
+            speaker1_name (str): Name/identifier for Speaker 1
+            speaker1_voice (str): Voice for Speaker 1
+            speaker2_name (str): Name/identifier for Speaker 2
+            speaker2_voice (str): Voice for Speaker 2
+            instructive_prefix (str): Text prepended to the script
+            
+        Returns:
+            str: Path of the cached WAV file for this request (which may not exist yet)
+        """
+        key = hashlib.blake2b(digest_size=16)
+        for field in (model_name, speaker1_name, speaker1_voice, speaker2_name, speaker2_voice, instructive_prefix, script):
+            key.update(field.encode("utf-8"))
+            key.update(b"\0")  # Field separator so adjacent fields can't run together
+        return os.path.join(self._cache_dir, key.hexdigest() + ".wav")
+    
+    def _load_cached(self, cache_path, output_file):
+        """
+        Copy a cached synthesis result to the output path, if one exists.
+        
+        Args:
+            cache_path (str): Path of the cached WAV file
+            output_file (str): Requested output path
+            
+        Returns:
+            str: Path to the output file, or None on a cache miss
+        """
+        if not os.path.exists(cache_path):
+            return None
+        output_file = f"{os.path.splitext(output_file)[0]}.wav"
+        try:
+            shutil.copyfile(cache_path, output_file)
+            os.utime(cache_path)  # Mark as recently used so pruning keeps it
+        except OSError:
+            return None  # Fall back to synthesizing
+        logger.info("File saved to: %s (cached)", output_file)
+        return output_file
+    
+    def _store_cached(self, output_file, cache_path):
+        """
+        Add a freshly synthesized WAV file to the cache.
+        
+        Args:
+            output_file (str): Path of the synthesized audio file
+            cache_path (str): Path of the cached WAV file
+        """
+        if not output_file.endswith(".wav"):
+            return
+        # Copy to a temporary name first so concurrent lookups never see a partial file
+        tmp_path = None
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".part")
+            os.close(fd)
+            shutil.copyfile(output_file, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best-effort; just drop any partial copy
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._prune_cache()
+    
+    def _prune_cache(self, max_bytes=AUDIO_CACHE_MAX_BYTES):
+        """
+        Remove the least recently used cached files until the cache fits in max_bytes.
+        
+        Args:
+            max_bytes (int): Maximum total size of the cached WAV files
+        """
+        entries = []
+        total_bytes = 0
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".wav"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # Removed by a concurrent prune
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_bytes += stat.st_size
+        except OSError:
+            return
+        if total_bytes <= max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_bytes -= size
+            if total_bytes <= max_bytes:
+                break
+    
+    def _get_speech_config(self, speaker1_name, speaker1_voice, speaker2_name, speaker2_voice):
+        """
+        Get the multi-speaker generation config, building it only the first time a speaker/voice pairing is used.
+        
+        Args:
+            speaker1_name (str): Name/identifier for Speaker 1 in the script
+            speaker1_voice (str): Voice to use for Speaker 1
+            speaker2_name (str): Name/identifier for Speaker 2 in the script
+            speaker2_voice (str): Voice to use for Speaker 2
+            
+        Returns:
+            types.GenerateContentConfig: Config for the speech generation request
+        """
+        key = (speaker1_name, speaker1_voice, speaker2_name, speaker2_voice)
+        generate_content_config = self._config_cache.get(key)
+        if generate_content_config is None:
             # Configure the speech generation for multi-speaker
             generate_content_config = types.GenerateContentConfig(
                 temperature=1, 
@@ -105,7 +723,7 @@ class AudioSynthesizer:
                                 speaker=speaker1_name,
                                 voice_config=types.VoiceConfig(
                                     prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                        voice_name=s1_voice
+                                        voice_name=speaker1_voice
                                     )
                                 ),
                             ),
@@ -113,7 +731,7 @@ class AudioSynthesizer:
                                 speaker=speaker2_name,
                                 voice_config=types.VoiceConfig(
                                     prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                        voice_name=s2_voice
+                                        voice_name=speaker2_voice
                                     )
                                 ),
                             ),
@@ -121,99 +739,37 @@ class AudioSynthesizer:
                     ),
                 ),
             )
-            
-            # Prepare the content for generation
-            # Prepend an instructive phrase to guide the TTS model's tone and adherence to script cues.
-            prefixed_script = instructive_prefix + script
-            contents = [
-                types.Content(
-                    role="user",
-                    parts=[
-                        types.Part.from_text(text=prefixed_script),
-                    ],
-                ),
-            ]
-            
-            # Generate the audio content
-            audio_data = None
-            for chunk in self.client.models.generate_content_stream(
-                model=model_name,
-                contents=contents,
-                config=generate_content_config,
-            ):
-                if (
-                    chunk.candidates is None
-                    or chunk.candidates[0].content is None
-                    or chunk.candidates[0].content.parts is None
-                ):
-                    continue
-                
-                if chunk.candidates[0].content.parts[0].inline_data:
-                    inline_data = chunk.candidates[0].content.parts[0].inline_data
-                    data_buffer = inline_data.data
-                    file_extension = mimetypes.guess_extension(inline_data.mime_type)
-                    
-                    if file_extension is None:
-                        file_extension = ".wav"
-                        data_buffer = self._convert_to_wav(inline_data.data, inline_data.mime_type)
-                    
-                    # Ensure output file has correct extension
-                    if not output_file.endswith(file_extension):
-                        output_file = f"{os.path.splitext(output_file)[0]}{file_extension}"
-                    
-                    # Save the audio data
-                    self._save_binary_file(output_file, data_buffer)
-                    audio_data = data_buffer
-                    break
-            
-            if audio_data:
-                return output_file
-            else:
-                return "Error: No audio data generated"
-
-        except google_exceptions.InvalidArgument as e:
-            return f"API Invalid Argument error synthesizing audio ({type(e).__name__}): {str(e)}"
-        except google_exceptions.GoogleAPIError as e:
-            return f"Google API Error synthesizing audio ({type(e).__name__}): {str(e)}"
-        except Exception as e:
-            return f"Unexpected error synthesizing audio ({type(e).__name__}): {str(e)}"
-    
-    def _save_binary_file(self, file_name, data):
-        """
-        Save binary data to a file.
-        
-        Args:
-            file_name (str): Path to save the file
-            data (bytes): Binary data to save
-        """
-        with open(file_name, "wb") as f:
-            f.write(data)
-        print(f"File saved to: {file_name}")
+            self._config_cache[key] = generate_content_config
+        return generate_content_config
     
-    def _convert_to_wav(self, audio_data, mime_type):
+    def _wav_header(self, data_size, parameters):
         """
-        Generates a WAV file header for the given audio data and parameters.
+        Generates a WAV file header for raw audio data of the given size.
         
         Args:
-            audio_data (bytes): The raw audio data
-            mime_type (str): Mime type of the audio data
+            data_size (int): Size of the raw audio data in bytes
+            parameters (dict): Audio parameters with "bits_per_sample" and "rate" keys
             
         Returns:
-            bytes: WAV formatted audio data
+            bytes: The 44-byte WAV header
         """
-        parameters = self._parse_audio_mime_type(mime_type)
         bits_per_sample = parameters["bits_per_sample"]
         sample_rate = parameters["rate"]
         num_channels = 1
-        data_size = len(audio_data)
+        
+        if (bits_per_sample, sample_rate) == (16, 24000):
+            header = bytearray(self._wav_header_template_24k16)
+            _UINT32_STRUCT.pack_into(header, 4, 36 + data_size)  # ChunkSize
+            _UINT32_STRUCT.pack_into(header, 40, data_size)      # Subchunk2Size
+            return bytes(header)
+        
         bytes_per_sample = bits_per_sample // 8
         block_align = num_channels * bytes_per_sample
         byte_rate = sample_rate * block_align
         chunk_size = 36 + data_size  # 36 bytes for header fields before data chunk size
         
         # WAV header format: http://soundfile.sapp.org/doc/WaveFormat/
-        header = struct.pack(
-            "<4sI4s4sIHHIIHH4sI",
+        return _WAV_HEADER_STRUCT.pack(
             b"RIFF",          # ChunkID
             chunk_size,       # ChunkSize (total file size - 8 bytes)
             b"WAVE",          # Format
@@ -228,7 +784,26 @@ class AudioSynthesizer:
             b"data",          # Subchunk2ID
             data_size         # Subchunk2Size (size of audio data)
         )
-        return header + audio_data
+    
+    def _audio_format(self, mime_type):
+        """
+        Determines the output file extension for an audio MIME type.
+        
+        Args:
+            mime_type (str): The audio MIME type string (e.g., "audio/L16;rate=24000")
+            
+        Returns:
+            tuple: (file_extension, parameters), where parameters is the dict from
+                   _parse_audio_mime_type if the data is raw PCM needing a WAV header, else None
+        """
+        fast_format = _FAST_MIME.get(mime_type)
+        if fast_format is not None:
+            return fast_format
+        
+        file_extension = mimetypes.guess_extension(mime_type)
+        if file_extension is None:
+            return ".wav", self._parse_audio_mime_type(mime_type)
+        return file_extension, None
     
     def _parse_audio_mime_type(self, mime_type):
         """
@@ -243,25 +818,105 @@ class AudioSynthesizer:
         bits_per_sample = 16
         rate = 24000
         
-        # Extract rate from parameters
-        parts = mime_type.split(";")
-        for param in parts:
-            param = param.strip()
-            if param.lower().startswith("rate="):
+        # Only reached for types missing from _FAST_MIME, so favour strict parsing over speed:
+        # parameter names are case-insensitive and must match a whole "name=value" pair
+        media_type, *parameters = mime_type.split(";")
+        media_type = media_type.strip()
+        if media_type.startswith("audio/L"):
+            try:
+                bits_per_sample = int(media_type[7:])
+            except ValueError:
+                pass  # Keep bits_per_sample as default
+        for parameter in parameters:
+            name, has_value, value = parameter.partition("=")
+            if has_value and name.strip().lower() == "rate":
                 try:
-                    rate_str = param.split("=", 1)[1]
-                    rate = int(rate_str)
-                except (ValueError, IndexError):
+                    rate = int(value)
+                except ValueError:
                     pass  # Keep rate as default
-            elif param.startswith("audio/L"):
-                try:
-                    bits_per_sample = int(param.split("L", 1)[1])
-                except (ValueError, IndexError):
-                    pass  # Keep bits_per_sample as default
         
         return {"bits_per_sample": bits_per_sample, "rate": rate}
 
 
+class _AudioFileWriter:
+    """Writes streamed audio chunks straight to disk as they arrive from the API."""
+    
+    def __init__(self, synthesizer, output_file):
+        """
+        Initialize the writer. The file is only created once the first chunk arrives.
+        
+        Args:
+            synthesizer (AudioSynthesizer): Synthesizer used to build the WAV header
+            output_file (str): Requested output path; the extension may be adjusted to match the audio format
+        """
+        self.synthesizer = synthesizer
+        self.output_file = output_file
+        self._output_base, self._output_ext = os.path.splitext(output_file)
+        self.data_size = 0
+        self._file = None
+        self._part_file = None
+        self._wav_parameters = None
+    
+    def write(self, inline_data):
+        """
+        Append one chunk of audio data to the output file.
+        
+        Args:
+            inline_data: The inline_data part of a streamed response chunk
+        """
+        if self._file is None:
+            self._open(inline_data.mime_type)
+        self._file.write(inline_data.data)
+        self.data_size += len(inline_data.data)
+    
+    def close(self):
+        """
+        Finish the output file, filling in the WAV header now that the data size is known.
+        
+        The audio is written to a temporary ".part" file and only moved into place once
+        complete, so a crash mid-stream never leaves a truncated file at the output path.
+        
+        Returns:
+            bool: True if any audio data was written
+        """
+        if self._file is None:
+            return False
+        try:
+            if self._wav_parameters is not None:
+                self._file.seek(0)
+                self._file.write(self.synthesizer._wav_header(self.data_size, self._wav_parameters))
+            self._file.flush()
+            _sync_file_data(self._file.fileno())
+        except BaseException:
+            self.discard()
+            raise
+        self._file.close()
+        os.replace(self._part_file, self.output_file)
+        return True
+    
+    def discard(self):
+        """Abandon the output, removing any partially written data."""
+        if self._file is None:
+            return
+        self._file.close()
+        if os.path.exists(self._part_file):
+            os.remove(self._part_file)
+    
+    def _open(self, mime_type):
+        """Pick the file extension from the first chunk's mime type and open the output file."""
+        # Raw PCM gets a WAV header, written once the data size is known
+        file_extension, self._wav_parameters = self.synthesizer._audio_format(mime_type)
+        
+        # Ensure output file has correct extension
+        if file_extension != self._output_ext:
+            self.output_file = self._output_base + file_extension
+        
+        self._part_file = f"{self.output_file}.part"
+        self._file = open(self._part_file, "wb", buffering=OUTPUT_BUFFER_SIZE)
+        if self._wav_parameters is not None:
+            self._file.seek(WAV_HEADER_SIZE)
+
+
 # Example usage
 if __name__ == "__main__":
     # For testing purposes
@@ -5,11 +5,25 @@ This module integrates the text generation and audio synthesis components
 into a unified pipeline for the Auto Daddy ASMR audio generation tool.
 """
 
+import asyncio
+import concurrent.futures
 import os
 import time
-from datetime import datetime
-from gemini_text_generator import GeminiTextGenerator
-from audio_synthesizer import AudioSynthesizer
+from gemini_text_generator import GeminiTextGenerator, MAX_CONCURRENT_REQUESTS
+from audio_synthesizer import AudioSynthesizer, DEFAULT_INSTRUCTIVE_PREFIX, MAX_BATCH_WORKERS
+
+# Flags for saving scripts with os.open (O_BINARY keeps Windows from translating newlines)
+_SCRIPT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _ts():
+    """
+    Get the local-time timestamp used in generated filenames.
+    
+    Returns:
+        str: Timestamp formatted as YYYYmmdd_HHMMSS
+    """
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime())
 
 
 class AutoDaddy:
@@ -31,13 +45,10 @@ class AutoDaddy:
         self.output_dir = output_dir or os.path.join(os.getcwd(), "output")
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Initialize components
+        # Initialize components. AutoDaddy keeps no per-call state (scripts are passed
+        # explicitly), so one instance can serve concurrent calls.
         self.text_generator = GeminiTextGenerator(api_key=self.api_key)
         self.audio_synthesizer = AudioSynthesizer(api_key=self.api_key)
-        
-        # Track current script and audio
-        self.current_script = None
-        self.current_audio_path = None
     
     def generate_script(self, theme="comforting", length="medium", custom_prompt=None, speaker1_name="Speaker1", speaker2_name="Speaker2"):
         """
@@ -53,37 +64,45 @@ class AutoDaddy:
         Returns:
             str: Generated script
         """
-        self.current_script = self.text_generator.generate_script(
+        return self.text_generator.generate_script(
             theme=theme,
             length=length,
             custom_prompt=custom_prompt,
             speaker1_name=speaker1_name,
             speaker2_name=speaker2_name
         )
-        return self.current_script
     
-    def set_manual_script(self, script_text):
+    def generate_scripts(self, specs):
         """
-        Set a manually created script.
+        Generate several ASMR scripts concurrently.
+        
+        Requests are fanned out over a bounded thread pool using the synchronous client, so
+        this can be called any number of times (and from code already running an event loop).
         
         Args:
-            script_text (str): The manually created script text.
-                               Users should ensure it's formatted correctly for two speakers if intended.
+            specs (list[dict]): One dict per script with any of the generate_script keyword
+                                arguments (theme, length, custom_prompt, speaker1_name, speaker2_name)
             
         Returns:
-            str: The script text as set.
+            list[str]: Generated script or error message for each spec, in input order
         """
-        # Removed automatic "Speaker 1:" prepending. 
-        # Users providing manual scripts are responsible for their formatting.
-        self.current_script = script_text
-        return self.current_script
+        if not specs:
+            return []
+        specs = [{"speaker1_name": "Speaker1", "speaker2_name": "Speaker2", **spec} for spec in specs]
+        
+        def generate(spec):
+            return self.text_generator.generate_script(**spec)
+        
+        max_workers = min(MAX_CONCURRENT_REQUESTS, len(specs))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(generate, specs))
     
-    def generate_audio(self, script=None, tts_model_name="gemini-2.5-pro-preview-tts", speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", output_filename=None, instructive_prefix="Read aloud in a natural, engaging tone, following the speaker cues and any emotional or contextual notes provided in the script:\n\n"):
+    def generate_audio(self, script, tts_model_name="gemini-2.5-pro-preview-tts", speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", output_filename=None, instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX):
         """
-        Generate audio from the current or provided script for two speakers.
+        Generate audio from a script for two speakers.
         
         Args:
-            script (str, optional): Script to use. If None, uses current_script.
+            script (str): Script to synthesize.
             tts_model_name (str): Name of the TTS model to use (e.g., "gemini-2.5-pro-preview-tts", "gemini-2.5-flash-preview-tts").
             speaker1_name (str): Name/identifier for Speaker 1 in the script.
             speaker1_voice (str): Voice to use for Speaker 1.
@@ -95,22 +114,48 @@ class AutoDaddy:
         Returns:
             str: Path to the generated audio file or error message
         """
-        # Use provided script or current script
-        script_to_use = script or self.current_script
-        if not script_to_use:
-            return "Error: No script available. Generate or set a script first."
+        if not script:
+            return "Error: No script available. Generate or enter a script first."
         
-        # Generate filename if not provided
-        if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"asmr_daddy_{timestamp}.wav"
+        output_path = self._audio_output_path(output_filename)
         
-        # Ensure output path is absolute
-        output_path = os.path.join(self.output_dir, output_filename)
+        # Generate audio
+        return self.audio_synthesizer.synthesize_audio(
+            script=script,
+            output_file=output_path,
+            model_name=tts_model_name,
+            speaker1_name=speaker1_name,
+            speaker1_voice=speaker1_voice,
+            speaker2_name=speaker2_name,
+            speaker2_voice=speaker2_voice,
+            instructive_prefix=instructive_prefix
+        )
+    
+    async def generate_audio_async(self, script, tts_model_name="gemini-2.5-pro-preview-tts", speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", output_filename=None, instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX):
+        """
+        Asynchronously generate audio from a script for two speakers.
+        
+        Args:
+            script (str): Script to synthesize.
+            tts_model_name (str): Name of the TTS model to use (e.g., "gemini-2.5-pro-preview-tts", "gemini-2.5-flash-preview-tts").
+            speaker1_name (str): Name/identifier for Speaker 1 in the script.
+            speaker1_voice (str): Voice to use for Speaker 1.
+            speaker2_name (str): Name/identifier for Speaker 2 in the script.
+            speaker2_voice (str): Voice to use for Speaker 2.
+            output_filename (str, optional): Custom filename. If None, generates one.
+            instructive_prefix (str): Text to prepend to the script to guide TTS model tone.
+            
+        Returns:
+            str: Path to the generated audio file or error message
+        """
+        if not script:
+            return "Error: No script available. Generate or enter a script first."
+        
+        output_path = self._audio_output_path(output_filename)
         
         # Generate audio
-        self.current_audio_path = self.audio_synthesizer.synthesize_audio(
-            script=script_to_use,
+        return await self.audio_synthesizer.synthesize_audio_async(
+            script=script,
             output_file=output_path,
             model_name=tts_model_name,
             speaker1_name=speaker1_name,
@@ -119,37 +164,213 @@ class AutoDaddy:
             speaker2_voice=speaker2_voice,
             instructive_prefix=instructive_prefix
         )
+    
+    def generate_audio_streaming(self, theme="comforting", length="medium", custom_prompt=None, tts_model_name="gemini-2.5-pro-preview-tts", speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", output_filename=None, instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX):
+        """
+        Generate a new script and its audio in one pipelined pass.
+        
+        Script lines are handed to the audio synthesizer while the rest of the script is
+        still being generated, so synthesis starts long before the full text is available.
+        
+        Args:
+            theme (str): Theme for the ASMR content
+            length (str): Desired script length ("short", "medium", "long", "very long")
+            custom_prompt (str, optional): Custom prompt to override default
+            tts_model_name (str): Name of the TTS model to use.
+            speaker1_name (str): Name for Speaker 1.
+            speaker1_voice (str): Voice to use for Speaker 1.
+            speaker2_name (str): Name for Speaker 2.
+            speaker2_voice (str): Voice to use for Speaker 2.
+            output_filename (str, optional): Custom filename. If None, generates one.
+            instructive_prefix (str): Text to prepend to the script to guide TTS model tone.
+            
+        Returns:
+            tuple: (path to the generated audio file or error message, generated script)
+        """
+        output_path = self._audio_output_path(output_filename)
+        script_lines = []
         
-        return self.current_audio_path
+        def record_lines():
+            for line in self.text_generator.stream_script(
+                theme=theme,
+                length=length,
+                custom_prompt=custom_prompt,
+                speaker1_name=speaker1_name,
+                speaker2_name=speaker2_name
+            ):
+                script_lines.append(line)
+                yield line
+        
+        audio_path = self.audio_synthesizer.synthesize_audio_stream(
+            script_lines=record_lines(),
+            output_file=output_path,
+            model_name=tts_model_name,
+            speaker1_name=speaker1_name,
+            speaker1_voice=speaker1_voice,
+            speaker2_name=speaker2_name,
+            speaker2_voice=speaker2_voice,
+            instructive_prefix=instructive_prefix
+        )
+        
+        return audio_path, "\n".join(script_lines)
+    
+    def generate_audio_batch(self, scripts, tts_model_name="gemini-2.5-pro-preview-tts", speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", output_filenames=None, instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX):
+        """
+        Generate audio for several scripts concurrently using the same voices.
+        
+        Args:
+            scripts (list[str]): Scripts to synthesize.
+            tts_model_name (str): Name of the TTS model to use.
+            speaker1_name (str): Name/identifier for Speaker 1 in the scripts.
+            speaker1_voice (str): Voice to use for Speaker 1.
+            speaker2_name (str): Name/identifier for Speaker 2 in the scripts.
+            speaker2_voice (str): Voice to use for Speaker 2.
+            output_filenames (list[str], optional): Custom filenames, one per script. If None, generates them.
+            instructive_prefix (str): Text to prepend to each script to guide TTS model tone.
+            
+        Returns:
+            list[str]: Path to the generated audio file or error message for each script
+        """
+        output_paths = self._batch_output_paths(scripts, output_filenames)
+        
+        return self.audio_synthesizer.synthesize_audio_batch(
+            scripts=scripts,
+            output_files=output_paths,
+            model_name=tts_model_name,
+            speaker1_name=speaker1_name,
+            speaker1_voice=speaker1_voice,
+            speaker2_name=speaker2_name,
+            speaker2_voice=speaker2_voice,
+            instructive_prefix=instructive_prefix
+        )
+    
+    async def generate_audio_batch_async(self, scripts, tts_model_name="gemini-2.5-pro-preview-tts", speaker1_name="Speaker1", speaker1_voice="Enceladus", speaker2_name="Speaker2", speaker2_voice="Puck", output_filenames=None, instructive_prefix=DEFAULT_INSTRUCTIVE_PREFIX):
+        """
+        Asynchronously generate audio for several scripts at once using the same voices.
+        
+        Args:
+            scripts (list[str]): Scripts to synthesize.
+            tts_model_name (str): Name of the TTS model to use.
+            speaker1_name (str): Name/identifier for Speaker 1 in the scripts.
+            speaker1_voice (str): Voice to use for Speaker 1.
+            speaker2_name (str): Name/identifier for Speaker 2 in the scripts.
+            speaker2_voice (str): Voice to use for Speaker 2.
+            output_filenames (list[str], optional): Custom filenames, one per script. If None, generates them.
+            instructive_prefix (str): Text to prepend to each script to guide TTS model tone.
+            
+        Returns:
+            list[str]: Path to the generated audio file or error message for each script
+        """
+        output_paths = self._batch_output_paths(scripts, output_filenames)
+        
+        # Same bound as the thread-pool batch, so a large batch doesn't open every file at once
+        semaphore = asyncio.Semaphore(MAX_BATCH_WORKERS)
+        
+        async def synthesize(script, output_path):
+            async with semaphore:
+                return await self.audio_synthesizer.synthesize_audio_async(
+                    script=script,
+                    output_file=output_path,
+                    model_name=tts_model_name,
+                    speaker1_name=speaker1_name,
+                    speaker1_voice=speaker1_voice,
+                    speaker2_name=speaker2_name,
+                    speaker2_voice=speaker2_voice,
+                    instructive_prefix=instructive_prefix
+                )
+        
+        return await asyncio.gather(*(
+            synthesize(script, output_path) for script, output_path in zip(scripts, output_paths)
+        ))
     
-    def save_script(self, filename=None):
+    def save_script(self, script, filename=None):
         """
-        Save the current script to a text file.
+        Save a script to a text file.
         
         Args:
+            script (str): Script to save.
             filename (str, optional): Custom filename. If None, generates one.
             
         Returns:
             str: Path to the saved script file or error message
         """
-        if not self.current_script:
+        if not script:
             return "Error: No script available to save."
         
         # Generate filename if not provided
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _ts()
             filename = f"asmr_script_{timestamp}.txt"
         
         # Ensure output path is absolute
         output_path = os.path.join(self.output_dir, filename)
         
         try:
-            with open(output_path, 'w') as f:
-                f.write(self.current_script)
+            # Write the encoded bytes straight to the file descriptor, skipping the text I/O layer
+            data = memoryview(script.encode("utf-8"))
+            fd = os.open(output_path, _SCRIPT_OPEN_FLAGS, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             return output_path
         except Exception as e:
             return f"Error saving script: {str(e)}"
     
+    async def save_script_async(self, script, filename=None):
+        """
+        Save a script to a text file without blocking the event loop.
+        
+        Args:
+            script (str): Script to save.
+            filename (str, optional): Custom filename. If None, generates one.
+            
+        Returns:
+            str: Path to the saved script file or error message
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.save_script, script, filename)
+    
+    def _audio_output_path(self, output_filename=None):
+        """
+        Build the absolute output path for an audio file.
+        
+        Args:
+            output_filename (str, optional): Custom filename. If None, generates one.
+            
+        Returns:
+            str: Absolute path inside the output directory
+        """
+        # Generate filename if not provided
+        if not output_filename:
+            timestamp = _ts()
+            output_filename = f"asmr_daddy_{timestamp}.wav"
+        
+        # Ensure output path is absolute
+        return os.path.join(self.output_dir, output_filename)
+    
+    def _batch_output_paths(self, scripts, output_filenames=None):
+        """
+        Build the absolute output paths for a batch of audio files.
+        
+        Args:
+            scripts (list[str]): Scripts in the batch.
+            output_filenames (list[str], optional): Custom filenames, one per script. If None, generates them.
+            
+        Returns:
+            list[str]: Absolute paths inside the output directory, one per script
+        """
+        # Generate filenames if not provided
+        if not output_filenames:
+            timestamp = _ts()
+            output_filenames = [f"asmr_daddy_{timestamp}_{i}.wav" for i in range(len(scripts))]
+        elif len(output_filenames) != len(scripts):
+            raise ValueError("output_filenames must have one entry per script.")
+        
+        # Ensure output paths are absolute
+        return [os.path.join(self.output_dir, filename) for filename in output_filenames]
+    
     def get_available_voices(self):
         """
         Get list of available voices.
@@ -197,7 +418,8 @@ if __name__ == "__main__":
     if not script.startswith("Error"): # Proceed only if script generation was successful
         print(f"Generating two-speaker audio with voices {s1_voice} for {s1_name} and {s2_voice} for {s2_name}...")
         audio_path = auto_daddy.generate_audio(
-                tts_model_name="gemini-2.5-flash-preview-tts",
+            script,
+            tts_model_name="gemini-2.5-flash-preview-tts",
             speaker1_name=s1_name,
             speaker1_voice=s1_voice,
             speaker2_name=s2_name,
@@ -208,5 +430,5 @@ if __name__ == "__main__":
         print("Skipping audio generation due to script generation error.")
     
     # Test script saving
-    script_path = auto_daddy.save_script()
+    script_path = auto_daddy.save_script(script)
     print(f"Script saved: {script_path}")
@@ -0,0 +1,114 @@
+"""
+Gemini Client Module for Auto Daddy
+
+This module provides shared Google Gemini API clients, so the text generator and
+audio synthesizer reuse one client (and its connection pool) per API key instead
+of opening new connections every time a component is constructed.
+
+The async side of a client keeps its connections bound to the event loop it was
+first used on, so sync callers share one client per API key (get_client) while
+async callers get one per API key and event loop (get_async_client).
+"""
+
+import asyncio
+import threading
+import weakref
+import httpx
+from google import genai
+from google.genai import types
+
+# HTTP/2 needs the h2 package, which requirements.txt pulls in through httpx[http2];
+# installs without it fall back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Keep-alive connections per pool, enough for the concurrent batch helpers
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+_CLIENT_CACHE = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Async clients keyed by event loop, then API key
+_ASYNC_CLIENT_CACHE = weakref.WeakKeyDictionary()
+
+
+def get_client(api_key):
+    """
+    Get the shared Gemini API client for an API key, creating it on first use.
+    
+    Only use the returned client's synchronous interface; its aio side would be
+    bound to whichever event loop used it first. Use get_async_client instead.
+    
+    Args:
+        api_key (str): Google Gemini API key
+        
+    Returns:
+        genai.Client: Client shared by all callers using the same API key
+    """
+    client = _CLIENT_CACHE.get(api_key)
+    if client is None:
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(api_key)
+            if client is None:
+                client = _CLIENT_CACHE[api_key] = _create_client(api_key)
+    return client
+
+
+def get_async_client(api_key):
+    """
+    Get the async Gemini API client for an API key on the running event loop, creating it on first use.
+    
+    Each event loop gets its own client, so code run with asyncio.run more than once
+    never reuses connections that belong to a closed loop.
+    
+    Args:
+        api_key (str): Google Gemini API key
+        
+    Returns:
+        The client's aio interface, shared by all callers on this loop using the same API key
+    
+    Raises:
+        RuntimeError: If called without a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _CLIENT_CACHE_LOCK:
+        # The clients' connections can keep their loop alive, so drop closed loops explicitly
+        for closed_loop in [cached_loop for cached_loop in _ASYNC_CLIENT_CACHE if cached_loop.is_closed()]:
+            del _ASYNC_CLIENT_CACHE[closed_loop]
+        clients = _ASYNC_CLIENT_CACHE.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = clients[api_key] = _create_client(api_key).aio
+    return client
+
+
+def _create_client(api_key):
+    """
+    Create a Gemini API client, multiplexing requests over HTTP/2 when possible.
+    
+    Args:
+        api_key (str): Google Gemini API key
+        
+    Returns:
+        genai.Client: New client for the API key
+    """
+    if HTTP2_AVAILABLE:
+        transport_args = {
+            "http2": True,
+            "limits": httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        }
+        try:
+            http_options = types.HttpOptions(
+                client_args=transport_args,
+                async_client_args=dict(transport_args),
+            )
+        except (AttributeError, TypeError, ValueError):
+            # Older google-genai releases don't accept custom httpx client arguments
+            http_options = None
+        if http_options is not None:
+            return genai.Client(api_key=api_key, http_options=http_options)
+    return genai.Client(api_key=api_key)
@@ -5,29 +5,97 @@ This module handles text generation for ASMR daddy content using Google's Gemini
 It includes functionality for script length customization and prompt engineering.
 """
 
+import asyncio
+import collections
+import contextlib
+import hashlib
 import os
-from google import genai
+import sqlite3
+import string
+import threading
+import time
+from types import MappingProxyType
 from google.genai import types
 from google.api_core import exceptions as google_exceptions
+from gemini_client import get_async_client, get_client
+
+# Maximum number of script requests generate_many keeps in flight, to stay under API rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds between status checks while waiting for a batch job
+BATCH_POLL_INTERVAL = 30
+
+# Default number of seconds batch_generate waits for a batch job before giving up on it
+BATCH_TIMEOUT = 2 * 60 * 60
+
+# Batch job states after which the job will not change any more
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED"
+})
+
+# Approximate word count for each script length
+_LENGTH_MAP = MappingProxyType({
+    "short": 150,
+    "medium": 300,
+    "long": 600,
+    "very long": 1000
+})
+
+# Default prompt, filled in by _create_prompt
+_PROMPT_TEMPLATE = string.Template("""
+        Create an ASMR script with a ${theme} tone, approximately ${word_count} words long.
+        The script should be a dialogue between two speakers: ${speaker1_name} and ${speaker2_name}.
+        Format the script with '${speaker1_name}:' and '${speaker2_name}:' prefixes before each respective line of dialogue.
+        Include appropriate pauses like [pause] and soft sounds like [soft laugh] where suitable.
+        The content should be soothing and appropriate for relaxation.
+        Ensure a natural conversational flow.
+        """)
+
+# Default location of the persistent script cache, and how many scripts to also keep in memory
+DEFAULT_SCRIPT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "auto_daddy", "scripts.sqlite")
+SCRIPT_CACHE_MEMORY_SIZE = 256
+
+# Cached scripts older than this (in seconds) are ignored and pruned, and at most
+# this many of the newest scripts are kept on disk
+SCRIPT_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+SCRIPT_CACHE_MAX_ENTRIES = 1000
 
 class GeminiTextGenerator:
     """Class for generating ASMR daddy scripts using Gemini 2.5 API."""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache_path=None):
         """
         Initialize the Gemini text generator.
         
         Args:
             api_key (str, optional): Google Gemini API key. If None, will try to get from environment.
+            cache_path (str, optional): SQLite file for cached scripts. If None, uses ~/.cache/auto_daddy/scripts.sqlite.
         """
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required. Set GEMINI_API_KEY environment variable or pass as parameter.")
         
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = get_client(self.api_key)
         self.model = "gemini-2.5-flash-preview-05-20" # Updated model name
+        self._cache = _ScriptCache(cache_path or DEFAULT_SCRIPT_CACHE_PATH)
+        
+        # The generation config doesn't depend on the prompt, so build it once and reuse it
+        self._gen_config = types.GenerateContentConfig(
+            response_mime_type="text/plain"
+        )
+        try:
+            self._gen_config.thinking_config = types.ThinkingConfig(thinking_budget=0)
+        except AttributeError:
+            # If types.ThinkingConfig doesn't exist or cannot be set, proceed without it
+            pass
+        
+        # Fetch the model in the background so the first request finds the connection warm
+        threading.Thread(target=self._warm_up, daemon=True).start()
     
-    def generate_script(self, theme="comforting", length="medium", custom_prompt=None, speaker1_name="Daddy", speaker2_name="Listener"):
+    def generate_script(self, theme="comforting", length="medium", custom_prompt=None, speaker1_name="Daddy", speaker2_name="Listener", use_cache=False):
         """
         Generate an ASMR script based on theme, desired length, and speaker names.
         
@@ -37,53 +105,112 @@ class GeminiTextGenerator:
             custom_prompt (str, optional): Custom prompt to override default
             speaker1_name (str): Name of the first speaker
             speaker2_name (str): Name of the second speaker
+            use_cache (bool): Return the script previously generated for an identical prompt, if any,
+                              and cache the new script otherwise. Off by default, so every call
+                              produces a fresh script.
             
         Returns:
             str: Generated script
         """
-        # Map length to approximate word count
-        length_map = {
-            "short": 150,
-            "medium": 300,
-            "long": 600,
-            "very long": 1000
-        }
-        
-        word_count = length_map.get(length.lower(), 300)  # Default to medium if not specified
-        
-        # Create prompt for Gemini
-        if custom_prompt:
-            prompt = custom_prompt
-        else:
-            prompt = self._create_prompt(theme, word_count, speaker1_name, speaker2_name)
+        prompt = self._build_prompt(theme, length, custom_prompt, speaker1_name, speaker2_name)
+        cache_key = self._cache_key(prompt)
+        if use_cache:
+            cached_script = self._cache.get(cache_key)
+            if cached_script is not None:
+                return cached_script
         
         # Generate content using Gemini
         try:
-            contents_payload = [types.Content(
-                role="user",
-                parts=[types.Part.from_text(text=prompt)]
-            )]
+            contents_payload, current_generate_content_config = self._build_request(prompt)
 
-            current_generate_content_config = types.GenerateContentConfig(
-                response_mime_type="text/plain"
-            )
-            try:
-                current_generate_content_config.thinking_config = types.ThinkingConfig(thinking_budget=0)
-            except AttributeError:
-                # If types.ThinkingConfig doesn't exist or cannot be set, proceed without it
-                pass
-
-            script_parts = []
-            for chunk in self.client.models.generate_content_stream(
+            # Single-shot request: the caller wants the whole script, so there is no point
+            # paying per-chunk overhead (use stream_script to consume lines as they arrive)
+            response = self.client.models.generate_content(
                 model=self.model,
                 contents=contents_payload,
                 config=current_generate_content_config,
-            ):
-                if chunk.text: # Ensure text exists
-                    script_parts.append(chunk.text)
+            )
+            script = self._format_script(self._response_text(response)) # Or just return raw_script
+            if script and use_cache:
+                self._cache.put(cache_key, script)
+            return script
+
+        except google_exceptions.InvalidArgument as e:
+            return f"API Invalid Argument error generating script ({type(e).__name__}): {str(e)}"
+        except google_exceptions.GoogleAPIError as e:
+            return f"Google API Error generating script ({type(e).__name__}): {str(e)}"
+        except Exception as e:
+            return f"Unexpected error generating script ({type(e).__name__}): {str(e)}"
+    
+    def stream_script(self, theme="comforting", length="medium", custom_prompt=None, speaker1_name="Daddy", speaker2_name="Listener"):
+        """
+        Generate an ASMR script, yielding each line as soon as it has been generated.
+        
+        Args:
+            theme (str): Theme for the ASMR content
+            length (str): Desired script length ("short", "medium", "long")
+            custom_prompt (str, optional): Custom prompt to override default
+            speaker1_name (str): Name of the first speaker
+            speaker2_name (str): Name of the second speaker
+            
+        Yields:
+            str: Script lines, without trailing newlines
+            
+        Raises:
+            google_exceptions.GoogleAPIError: If the API request fails
+        """
+        prompt = self._build_prompt(theme, length, custom_prompt, speaker1_name, speaker2_name)
+        contents_payload, current_generate_content_config = self._build_request(prompt)
+        
+        pending = ""
+        for chunk in self.client.models.generate_content_stream(
+            model=self.model,
+            contents=contents_payload,
+            config=current_generate_content_config,
+        ):
+            if not chunk.text:
+                continue
+            *lines, pending = (pending + chunk.text).split("\n")
+            yield from lines
+        if pending:
+            yield pending
+    
+    async def generate_script_async(self, theme="comforting", length="medium", custom_prompt=None, speaker1_name="Daddy", speaker2_name="Listener", use_cache=False):
+        """
+        Asynchronously generate an ASMR script based on theme, desired length, and speaker names.
+        
+        Args:
+            theme (str): Theme for the ASMR content
+            length (str): Desired script length ("short", "medium", "long")
+            custom_prompt (str, optional): Custom prompt to override default
+            speaker1_name (str): Name of the first speaker
+            speaker2_name (str): Name of the second speaker
+            use_cache (bool): Return the script previously generated for an identical prompt, if any,
+                              and cache the new script otherwise. Off by default, so every call
+                              produces a fresh script.
             
-            raw_script = "".join(script_parts)
-            return self._format_script(raw_script) # Or just return raw_script
+        Returns:
+            str: Generated script
+        """
+        prompt = self._build_prompt(theme, length, custom_prompt, speaker1_name, speaker2_name)
+        cache_key = self._cache_key(prompt)
+        if use_cache:
+            cached_script = self._cache.get(cache_key)
+            if cached_script is not None:
+                return cached_script
+        
+        # Generate content using Gemini
+        try:
+            contents_payload, current_generate_content_config = self._build_request(prompt)
+            response = await get_async_client(self.api_key).models.generate_content(
+                model=self.model,
+                contents=contents_payload,
+                config=current_generate_content_config,
+            )
+            script = self._format_script(self._response_text(response))
+            if script and use_cache:
+                self._cache.put(cache_key, script)
+            return script
 
         except google_exceptions.InvalidArgument as e:
             return f"API Invalid Argument error generating script ({type(e).__name__}): {str(e)}"
@@ -92,6 +219,199 @@ class GeminiTextGenerator:
         except Exception as e:
             return f"Unexpected error generating script ({type(e).__name__}): {str(e)}"
     
+    async def generate_many(self, specs, max_concurrency=MAX_CONCURRENT_REQUESTS):
+        """
+        Generate several scripts concurrently.
+        
+        Args:
+            specs (list[dict]): Keyword arguments for generate_script_async, one dict per script
+            max_concurrency (int): Maximum number of requests in flight at once
+            
+        Returns:
+            list[str]: Generated script or error message for each spec, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(spec):
+            async with semaphore:
+                return await self.generate_script_async(**spec)
+        
+        return await asyncio.gather(*(generate(spec) for spec in specs))
+    
+    def batch_generate(self, specs, poll_interval=BATCH_POLL_INTERVAL, use_cache=False, timeout=BATCH_TIMEOUT):
+        """
+        Generate several scripts with a single Gemini batch job.
+        
+        Batch jobs cost about half as much as online requests but can take minutes or hours
+        to finish, so this is meant for offline bulk generation rather than interactive use.
+        
+        Args:
+            specs (list[dict]): One dict per script with any of the generate_script keyword
+                                arguments (theme, length, custom_prompt, speaker1_name, speaker2_name)
+            poll_interval (float): Seconds to wait between job status checks
+            use_cache (bool): Reuse scripts previously generated for identical prompts instead of
+                              submitting them again, and cache the new scripts. Off by default, so
+                              every call produces fresh scripts.
+            timeout (float, optional): Seconds to wait for the job to finish before cancelling it and
+                                       returning an error for each pending script. If None, waits until
+                                       the job finishes or the server expires it.
+            
+        Returns:
+            list[str]: Generated script or error message for each spec, in input order
+        """
+        specs = [{"theme": "comforting", "length": "medium", "custom_prompt": None,
+                  "speaker1_name": "Daddy", "speaker2_name": "Listener", **spec} for spec in specs]
+        prompts = [
+            self._build_prompt(spec["theme"], spec["length"], spec["custom_prompt"],
+                               spec["speaker1_name"], spec["speaker2_name"])
+            for spec in specs
+        ]
+        cache_keys = [self._cache_key(prompt) for prompt in prompts]
+        scripts = [self._cache.get(key) if use_cache else None for key in cache_keys]
+        pending = [i for i, script in enumerate(scripts) if script is None]
+        if not pending:
+            return scripts
+        
+        try:
+            requests = []
+            for i in pending:
+                contents_payload, generate_content_config = self._build_request(prompts[i])
+                requests.append({"contents": contents_payload, "config": generate_content_config})
+            
+            batch_job = self.client.batches.create(model=self.model, src=requests)
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while batch_job.state.name not in _BATCH_DONE_STATES:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._cancel_batch(batch_job.name)
+                        error = (f"Error: Batch job {batch_job.name} did not finish within {timeout} seconds "
+                                 f"(last state {batch_job.state.name})")
+                        for i in pending:
+                            scripts[i] = error
+                        return scripts
+                    time.sleep(min(poll_interval, remaining))
+                else:
+                    time.sleep(poll_interval)
+                batch_job = self.client.batches.get(name=batch_job.name)
+            
+            if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+                error = f"Error: Batch job {batch_job.name} ended in state {batch_job.state.name}"
+                for i in pending:
+                    scripts[i] = error
+                return scripts
+            
+            for i, inlined in zip(pending, batch_job.dest.inlined_responses):
+                if inlined.error is not None:
+                    scripts[i] = f"Google API Error generating script: {inlined.error.message}"
+                    continue
+                script = self._format_script(self._response_text(inlined.response))
+                if script and use_cache:
+                    self._cache.put(cache_keys[i], script)
+                scripts[i] = script
+            for i in pending:
+                if scripts[i] is None:
+                    scripts[i] = f"Error: Batch job {batch_job.name} returned no response for this script"
+            return scripts
+        
+        except google_exceptions.GoogleAPIError as e:
+            error = f"Google API Error generating scripts ({type(e).__name__}): {str(e)}"
+        except Exception as e:
+            error = f"Unexpected error generating scripts ({type(e).__name__}): {str(e)}"
+        for i in pending:
+            scripts[i] = error
+        return scripts
+    
+    def _cancel_batch(self, name):
+        """
+        Ask the server to stop a batch job that is no longer being waited for.
+        
+        Args:
+            name (str): Name of the batch job
+        """
+        try:
+            self.client.batches.cancel(name=name)
+        except Exception:
+            # The job may have just finished; either way the caller has already given up on it
+            pass
+    
+    def _build_prompt(self, theme, length, custom_prompt, speaker1_name, speaker2_name):
+        """
+        Build the prompt for a script request.
+        
+        Args:
+            theme (str): Theme for the ASMR content
+            length (str): Desired script length ("short", "medium", "long", "very long")
+            custom_prompt (str, optional): Custom prompt to override default
+            speaker1_name (str): Name of the first speaker
+            speaker2_name (str): Name of the second speaker
+            
+        Returns:
+            str: The prompt to send to Gemini
+        """
+        # Create prompt for Gemini
+        if custom_prompt:
+            return custom_prompt
+        word_count = _LENGTH_MAP.get(length.lower(), 300)  # Default to medium if not specified
+        return self._create_prompt(theme, word_count, speaker1_name, speaker2_name)
+    
+    def _build_request(self, prompt):
+        """
+        Build the contents and generation config for a script request.
+        
+        Args:
+            prompt (str): The prompt to send to Gemini
+            
+        Returns:
+            tuple: (list of types.Content, the shared types.GenerateContentConfig)
+        """
+        contents_payload = [types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=prompt)]
+        )]
+        return contents_payload, self._gen_config
+    
+    def _response_text(self, response):
+        """
+        Extract the generated text from a non-streaming response.
+        
+        Args:
+            response (types.GenerateContentResponse): Response from generate_content
+            
+        Returns:
+            str: Generated text, or an empty string if the response has none
+        """
+        # The prompt yields a single text part, so read it directly instead of going
+        # through response.text, which joins and filters every part on each access
+        if not response.candidates or response.candidates[0].content is None:
+            return ""
+        parts = response.candidates[0].content.parts
+        if parts and len(parts) == 1:
+            return parts[0].text or ""
+        return response.text or ""
+    
+    def _warm_up(self):
+        """
+        Open the API connection ahead of the first request by fetching the model's metadata.
+        """
+        try:
+            self.client.models.get(model=self.model)
+        except Exception:
+            # Problems such as an invalid key are reported by the first real request
+            pass
+    
+    def _cache_key(self, prompt):
+        """
+        Get the cache key for a prompt sent to the current model.
+        
+        Args:
+            prompt (str): The prompt to send to Gemini
+            
+        Returns:
+            str: Hex digest identifying the (model, prompt) pair
+        """
+        return hashlib.blake2b(f"{self.model}\0{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+    
     def _create_prompt(self, theme, word_count, speaker1_name, speaker2_name):
         """
         Create a prompt for Gemini based on theme, word count, and speaker names.
@@ -105,14 +425,12 @@ class GeminiTextGenerator:
         Returns:
             str: Formatted prompt for Gemini
         """
-        return f"""
-        Create an ASMR script with a {theme} tone, approximately {word_count} words long.
-        The script should be a dialogue between two speakers: {speaker1_name} and {speaker2_name}.
-        Format the script with '{speaker1_name}:' and '{speaker2_name}:' prefixes before each respective line of dialogue.
-        Include appropriate pauses like [pause] and soft sounds like [soft laugh] where suitable.
-        The content should be soothing and appropriate for relaxation.
-        Ensure a natural conversational flow.
-        """
+        return _PROMPT_TEMPLATE.substitute(
+            theme=theme,
+            word_count=word_count,
+            speaker1_name=speaker1_name,
+            speaker2_name=speaker2_name
+        )
     
     def _format_script(self, raw_script):
         """
@@ -130,6 +448,119 @@ class GeminiTextGenerator:
         return raw_script
 
 
+class _ScriptCache:
+    """Exact-match cache of generated scripts: a small in-memory LRU in front of a SQLite file."""
+    
+    def __init__(self, path, memory_size=SCRIPT_CACHE_MEMORY_SIZE, max_entries=SCRIPT_CACHE_MAX_ENTRIES, max_age=SCRIPT_CACHE_MAX_AGE):
+        """
+        Initialize the cache. The SQLite file is only created on the first lookup or store.
+        
+        Args:
+            path (str): Path of the SQLite file
+            memory_size (int): Number of scripts to also keep in memory
+            max_entries (int): Number of the newest scripts to keep in the SQLite file
+            max_age (float): Seconds after which a cached script expires
+        """
+        self.path = path
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._opened = False
+    
+    def get(self, key):
+        """
+        Look up a cached script.
+        
+        Args:
+            key (str): Cache key
+            
+        Returns:
+            str: The cached script, or None on a miss
+        """
+        oldest = time.time() - self.max_age
+        with self._lock:
+            if key in self._memory:
+                created, script = self._memory[key]
+                if created >= oldest:
+                    self._memory.move_to_end(key)
+                    return script
+                del self._memory[key]
+        
+        if not self._open():
+            return None
+        try:
+            rows = self._execute(
+                "SELECT script, created FROM script_cache WHERE key = ? AND created >= ?", (key, oldest)
+            )
+        except sqlite3.Error:
+            return None
+        if not rows:
+            return None
+        script, created = rows[0]
+        self._remember(key, script, created)
+        return script
+    
+    def put(self, key, script):
+        """
+        Store a generated script, then drop expired scripts and any beyond max_entries.
+        
+        Args:
+            key (str): Cache key
+            script (str): The generated script
+        """
+        created = time.time()
+        self._remember(key, script, created)
+        if not self._open():
+            return
+        try:
+            self._execute(
+                "INSERT OR REPLACE INTO script_cache (key, script, created) VALUES (?, ?, ?)", (key, script, created)
+            )
+            self._execute(
+                "DELETE FROM script_cache WHERE created < ? OR key NOT IN "
+                "(SELECT key FROM script_cache ORDER BY created DESC LIMIT ?)",
+                (created - self.max_age, self.max_entries),
+            )
+        except sqlite3.Error:
+            pass  # Caching is best-effort
+    
+    def _open(self):
+        """
+        Create the SQLite file and table the first time the cache is used.
+        
+        Returns:
+            bool: Whether the persistent cache is available
+        """
+        with self._lock:
+            if not self._opened:
+                self._opened = True
+                try:
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                    self._execute(
+                        "CREATE TABLE IF NOT EXISTS script_cache "
+                        "(key TEXT PRIMARY KEY, script TEXT NOT NULL, created REAL NOT NULL)"
+                    )
+                except (OSError, sqlite3.Error):
+                    self.path = None  # Persistent cache unavailable; keep the in-memory cache only
+        return self.path is not None
+    
+    def _remember(self, key, script, created):
+        """Add a script to the in-memory LRU, evicting the least recently used entry if full."""
+        with self._lock:
+            self._memory[key] = (created, script)
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+    
+    def _execute(self, sql, parameters=()):
+        """Run one statement on a short-lived connection (safe to call from any thread) and return its rows."""
+        with contextlib.closing(sqlite3.connect(self.path)) as connection:
+            with connection:
+                return connection.execute(sql, parameters).fetchall()
+
+
 # Example usage
 if __name__ == "__main__":
     # For testing purposes
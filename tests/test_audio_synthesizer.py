@@ -0,0 +1,208 @@
+"""
+Auto Daddy - Audio Synthesizer Tests
+
+Offline tests for the audio synthesizer's streaming WAV output. The Gemini client is
+replaced with a fake, so no API key or network access is needed.
+"""
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from audio_synthesizer import AudioSynthesizer, WAV_HEADER_SIZE
+
+PCM_MIME_TYPE = "audio/L16;codec=pcm;rate=24000"
+
+
+def _chunk(data, mime_type=PCM_MIME_TYPE):
+    """Build a streamed response chunk carrying one inline audio payload."""
+    inline_data = SimpleNamespace(data=data, mime_type=mime_type)
+    part = SimpleNamespace(inline_data=inline_data)
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+class _FakeModels:
+    """Stands in for client.models, answering each request with the chunks chosen by respond."""
+
+    def __init__(self, respond):
+        self.respond = respond
+
+    def generate_content_stream(self, model, contents, config):
+        script = contents[0].parts[-1].text
+        return self.respond(script)
+
+
+class AudioSynthesizerTest(unittest.TestCase):
+    """Tests for AudioSynthesizer.synthesize_audio against a fake streaming client."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.synthesizer = AudioSynthesizer(api_key="test-key", cache_dir=os.path.join(self.temp_dir, "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _use_fake_stream(self, respond):
+        self.synthesizer.client = SimpleNamespace(models=_FakeModels(respond))
+
+    def _synthesize(self, script, **kwargs):
+        output_file = os.path.join(self.temp_dir, "out.wav")
+        return self.synthesizer.synthesize_audio(script, output_file, "test-model", **kwargs)
+
+    def test_header_sizes_after_multi_chunk_stream(self):
+        payloads = [b"\x01\x02" * 100, b"\x03\x04" * 50, b"\x05\x06" * 25]
+        self._use_fake_stream(lambda script: iter([_chunk(data) for data in payloads]))
+
+        result = self._synthesize("Speaker1: Hello there.")
+
+        with open(result, "rb") as f:
+            wav = f.read()
+        data = b"".join(payloads)
+        self.assertEqual(wav[:4], b"RIFF")
+        self.assertEqual(struct.unpack_from("<I", wav, 4)[0], 36 + len(data))
+        self.assertEqual(wav[36:40], b"data")
+        self.assertEqual(struct.unpack_from("<I", wav, 40)[0], len(data))
+        self.assertEqual(wav[WAV_HEADER_SIZE:], data)
+
+    def test_segments_written_in_input_order(self):
+        lines = [f"Speaker{i % 2 + 1}: line {i}" for i in range(6)]
+
+        def respond(script):
+            index = int(script.rsplit(" ", 1)[1])
+            # Later segments finish first, so out-of-order completion would show up in the output
+            time.sleep(0.01 * (len(lines) - index))
+            return iter([_chunk(bytes([index]) * 4), _chunk(bytes([index]) * 2)])
+
+        self._use_fake_stream(respond)
+
+        result = self._synthesize("\n".join(lines), max_segment_chars=1)
+
+        with open(result, "rb") as f:
+            audio = f.read()[WAV_HEADER_SIZE:]
+        self.assertEqual(audio, b"".join(bytes([i]) * 6 for i in range(len(lines))))
+
+    def test_parse_audio_mime_type_defaults_for_malformed_input(self):
+        cases = {
+            "": (16, 24000),
+            "garbage": (16, 24000),
+            "audio/L;rate=": (16, 24000),
+            "audio/Lx;rate=abc": (16, 24000),
+            ";;;": (16, 24000),
+            # Parameter names are case-insensitive
+            "audio/L16;Rate=16000": (16, 16000),
+            "audio/L16; RATE=16000": (16, 16000),
+            # "rate=" inside another parameter name is not the rate
+            "audio/L24;samplerate=8000": (24, 24000),
+            "audio/L16;codec=pcm;xrate=8000": (16, 24000),
+        }
+        for mime_type, (bits_per_sample, rate) in cases.items():
+            with self.subTest(mime_type=mime_type):
+                self.assertEqual(
+                    self.synthesizer._parse_audio_mime_type(mime_type),
+                    {"bits_per_sample": bits_per_sample, "rate": rate},
+                )
+
+    def test_failed_stream_leaves_no_partial_file(self):
+        def respond(script):
+            yield _chunk(b"\x00\x01" * 100)
+            raise RuntimeError("connection reset")
+
+        self._use_fake_stream(respond)
+
+        result = self._synthesize("Speaker1: Hello there.")
+
+        self.assertTrue(result.startswith("Unexpected error"))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+class AudioCacheTest(unittest.TestCase):
+    """Tests for the on-disk cache of synthesized audio."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.synthesizer = AudioSynthesizer(api_key="test-key", cache_dir=self.cache_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_file(self, path, data, mtime=None):
+        with open(path, "wb") as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def _cache_path(self, script="Speaker1: Hello there."):
+        return self.synthesizer._cache_path(script, "test-model", "Speaker1", "Puck", "Speaker2", "Zephyr", "")
+
+    def test_cache_dir_created_only_on_store(self):
+        self.assertFalse(os.path.exists(self.cache_dir))
+        cache_path = self._cache_path()
+        self.assertIsNone(self.synthesizer._load_cached(cache_path, os.path.join(self.temp_dir, "out.wav")))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+        audio_file = self._write_file(os.path.join(self.temp_dir, "audio.wav"), b"RIFF audio")
+        self.synthesizer._store_cached(audio_file, cache_path)
+
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(cache_path)])
+
+    def test_store_then_load_round_trip(self):
+        cache_path = self._cache_path()
+        audio_file = self._write_file(os.path.join(self.temp_dir, "audio.wav"), b"RIFF audio", mtime=1)
+        self.synthesizer._store_cached(audio_file, cache_path)
+        os.utime(cache_path, (1, 1))
+
+        # A cached result is always WAV, whatever extension was requested
+        loaded = self.synthesizer._load_cached(cache_path, os.path.join(self.temp_dir, "copy.mp3"))
+
+        self.assertEqual(loaded, os.path.join(self.temp_dir, "copy.wav"))
+        with open(loaded, "rb") as f:
+            self.assertEqual(f.read(), b"RIFF audio")
+        # The hit marks the entry as recently used
+        self.assertGreater(os.path.getmtime(cache_path), 1)
+
+    def test_store_skips_non_wav_output(self):
+        audio_file = self._write_file(os.path.join(self.temp_dir, "audio.mp3"), b"ID3")
+        self.synthesizer._store_cached(audio_file, self._cache_path())
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_store_is_best_effort_when_cache_dir_unusable(self):
+        # A file where the cache directory should be makes every cache operation fail
+        self._write_file(self.cache_dir, b"")
+        audio_file = self._write_file(os.path.join(self.temp_dir, "audio.wav"), b"RIFF audio")
+
+        self.synthesizer._store_cached(audio_file, self._cache_path())
+
+        self.assertIsNone(self.synthesizer._load_cached(self._cache_path(), os.path.join(self.temp_dir, "out.wav")))
+
+    def test_prune_removes_least_recently_used_first(self):
+        os.makedirs(self.cache_dir)
+        for name, mtime in (("old.wav", 100), ("newest.wav", 300), ("middle.wav", 200)):
+            self._write_file(os.path.join(self.cache_dir, name), b"x" * 100, mtime=mtime)
+        self._write_file(os.path.join(self.cache_dir, "other.part"), b"x" * 1000, mtime=0)
+
+        self.synthesizer._prune_cache(max_bytes=250)
+
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["middle.wav", "newest.wav", "other.part"])
+
+    def test_prune_keeps_cache_within_limit(self):
+        os.makedirs(self.cache_dir)
+        for i in range(3):
+            self._write_file(os.path.join(self.cache_dir, f"{i}.wav"), b"x" * 100, mtime=i)
+
+        self.synthesizer._prune_cache(max_bytes=300)
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
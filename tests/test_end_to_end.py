@@ -4,9 +4,11 @@ Auto Daddy - Test Script
 This script tests the end-to-end functionality of the Auto Daddy ASMR audio generation tool.
 """
 
+import asyncio
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,16 +41,28 @@ def test_auto_daddy():
         # Test AI script generation with different lengths
         print("\n2. Testing AI script generation with different lengths...")
         lengths = ["short", "medium", "long"]
-        for length in lengths:
+        
+        # Generate all lengths in parallel
+        def generate(length):
             print(f"\n   Generating {length} script...")
-            script = auto_daddy.generate_script(
+            return auto_daddy.generate_script(
                 theme=f"relaxation and comfort for {length} test", 
                 length=length
             )
+        
+        with ThreadPoolExecutor(max_workers=len(lengths)) as executor:
+            scripts = list(executor.map(generate, lengths))
+        for length, script in zip(lengths, scripts):
             print(f"   ✓ {length.capitalize()} script generated ({len(script.split())} words)")
-            
-            # Save the script
-            script_path = auto_daddy.save_script(f"test_script_{length}.txt")
+        
+        # Save all the scripts at the end, concurrently
+        async def save_scripts():
+            return await asyncio.gather(*(
+                auto_daddy.save_script_async(script, f"test_script_{length}.txt")
+                for length, script in zip(lengths, scripts)
+            ))
+        
+        for script_path in asyncio.run(save_scripts()):
             print(f"   ✓ Script saved to: {script_path}")
         
         # Test manual script input
@@ -58,11 +72,8 @@ def test_auto_daddy():
         Let me comfort you and help you relax.
         Just listen to my voice and let all your worries fade away.
         """
-        formatted_script = auto_daddy.set_manual_script(manual_script)
-        print("✓ Manual script set and formatted")
-        
         # Save the manual script
-        manual_script_path = auto_daddy.save_script("test_script_manual.txt")
+        manual_script_path = auto_daddy.save_script(manual_script, "test_script_manual.txt")
         print(f"✓ Manual script saved to: {manual_script_path}")
         
         # Test audio generation with different voices
@@ -71,16 +82,15 @@ def test_auto_daddy():
         
         # Generate audio from AI script
         print("\n   Generating audio from AI script...")
-        auto_daddy.generate_script(theme="bedtime relaxation", length="short")
+        ai_script = auto_daddy.generate_script(theme="bedtime relaxation", length="short")
         for voice in voices[:2]:  # Test with first two voices
             print(f"   Generating audio with {voice} voice...")
-            audio_path = auto_daddy.generate_audio(voice=voice, output_filename=f"test_audio_{voice}.wav")
+            audio_path = auto_daddy.generate_audio(script=ai_script, speaker1_voice=voice, output_filename=f"test_audio_{voice}.wav")
             print(f"   ✓ Audio generated: {audio_path}")
         
         # Generate audio from manual script
         print("\n   Generating audio from manual script...")
-        auto_daddy.set_manual_script(manual_script)
-        audio_path = auto_daddy.generate_audio(output_filename="test_audio_manual.wav")
+        audio_path = auto_daddy.generate_audio(script=manual_script, output_filename="test_audio_manual.wav")
         print(f"   ✓ Audio generated: {audio_path}")
         
         print("\n=== All tests completed successfully! ===")
@@ -0,0 +1,116 @@
+"""
+Auto Daddy - Gemini Client Tests
+
+Offline tests for the shared Gemini clients. A fake client stands in for genai.Client;
+like the real one, its async side only works on the event loop that first used it.
+"""
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import weakref
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gemini_client
+from auto_daddy import AutoDaddy
+
+
+class _LoopBoundAsyncModels:
+    """Stands in for client.aio.models, failing when used from a second event loop."""
+
+    def __init__(self):
+        self.loop = None
+
+    def _check_loop(self):
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop:
+            raise RuntimeError("Event loop is closed")
+
+    async def generate_content(self, model, contents, config):
+        self._check_loop()
+        part = SimpleNamespace(text="Speaker1: Hello there.")
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+    async def generate_content_stream(self, model, contents, config):
+        self._check_loop()
+
+        async def chunks():
+            inline_data = SimpleNamespace(data=b"\x00\x01" * 100, mime_type="audio/L16;codec=pcm;rate=24000")
+            part = SimpleNamespace(inline_data=inline_data)
+            yield SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+        return chunks()
+
+
+def _create_fake_client(api_key):
+    return SimpleNamespace(
+        models=SimpleNamespace(get=lambda model: None),
+        aio=SimpleNamespace(models=_LoopBoundAsyncModels()),
+    )
+
+
+class AsyncClientTest(unittest.TestCase):
+    """Tests that the async APIs keep working when each call runs on a new event loop."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for patcher in (
+            mock.patch.object(gemini_client, "_create_client", _create_fake_client),
+            mock.patch.dict(gemini_client._CLIENT_CACHE, clear=True),
+            mock.patch.object(gemini_client, "_ASYNC_CLIENT_CACHE", weakref.WeakKeyDictionary()),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.auto_daddy = AutoDaddy(api_key="test-key", output_dir=self.temp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_async_client_per_event_loop(self):
+        async def get_twice():
+            return gemini_client.get_async_client("test-key"), gemini_client.get_async_client("test-key")
+
+        first, same_loop = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+
+        self.assertIs(first, same_loop)
+        self.assertIsNot(first, second)
+
+    def test_generate_script_async_on_two_loops(self):
+        for _ in range(2):
+            script = asyncio.run(self.auto_daddy.text_generator.generate_script_async(theme="rain"))
+            self.assertEqual(script, "Speaker1: Hello there.")
+
+    def test_generate_many_on_two_loops(self):
+        specs = [{"theme": "rain"}, {"theme": "ocean"}]
+        for _ in range(2):
+            scripts = asyncio.run(self.auto_daddy.text_generator.generate_many(specs))
+            self.assertEqual(scripts, ["Speaker1: Hello there."] * 2)
+
+    def test_generate_audio_async_on_two_loops(self):
+        for i in range(2):
+            result = asyncio.run(self.auto_daddy.generate_audio_async(
+                "Speaker1: Hello there.", output_filename=f"single_{i}.wav"
+            ))
+            self.assertEqual(result, os.path.join(self.temp_dir, f"single_{i}.wav"))
+
+    def test_generate_audio_batch_async_on_two_loops(self):
+        for i in range(2):
+            results = asyncio.run(self.auto_daddy.generate_audio_batch_async(
+                ["Speaker1: Hello there.", "Speaker2: Hi."],
+                output_filenames=[f"batch_{i}_a.wav", f"batch_{i}_b.wav"],
+            ))
+            self.assertTrue(all(os.path.exists(result) for result in results), results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+Auto Daddy - Text Generator Tests
+
+Offline tests for the Gemini text generator's script cache and batch generation.
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gemini_client
+import gemini_text_generator
+from gemini_text_generator import GeminiTextGenerator, _ScriptCache
+
+
+class _FakeBatches:
+    """Stands in for client.batches, reporting a job as running for a fixed number of polls."""
+
+    def __init__(self, polls_until_done):
+        self.polls_until_done = polls_until_done
+        self.cancelled = []
+
+    def _job(self, state, responses=None):
+        return SimpleNamespace(
+            name="batches/test",
+            state=SimpleNamespace(name=state),
+            dest=SimpleNamespace(inlined_responses=responses),
+        )
+
+    def create(self, model, src):
+        self.count = len(src)
+        return self._job("JOB_STATE_PENDING")
+
+    def get(self, name):
+        self.polls_until_done -= 1
+        if self.polls_until_done > 0:
+            return self._job("JOB_STATE_RUNNING")
+        part = SimpleNamespace(text="Speaker1: Hello there.")
+        response = SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+        return self._job("JOB_STATE_SUCCEEDED", [SimpleNamespace(error=None, response=response)] * self.count)
+
+    def cancel(self, name):
+        self.cancelled.append(name)
+
+
+class ScriptCacheTest(unittest.TestCase):
+    """Tests for _ScriptCache expiry and trimming."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "cache", "scripts.sqlite")
+        self.now = 1000000.0
+        clock = mock.patch.object(gemini_text_generator.time, "time", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _stored_keys(self):
+        with sqlite3.connect(self.path) as connection:
+            rows = connection.execute("SELECT key FROM script_cache ORDER BY created").fetchall()
+        return [key for (key,) in rows]
+
+    def test_file_created_on_first_use(self):
+        cache = _ScriptCache(self.path)
+        self.assertFalse(os.path.exists(os.path.dirname(self.path)))
+
+        self.assertIsNone(cache.get("missing"))
+
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_round_trip_across_instances(self):
+        _ScriptCache(self.path).put("key", "Speaker1: Hello there.")
+        self.assertEqual(_ScriptCache(self.path).get("key"), "Speaker1: Hello there.")
+
+    def test_expired_scripts_are_ignored(self):
+        cache = _ScriptCache(self.path, max_age=60)
+        cache.put("key", "script")
+
+        self.now += 61
+
+        # Neither the in-memory copy nor the file may serve an expired script
+        self.assertIsNone(cache.get("key"))
+        self.assertIsNone(_ScriptCache(self.path, max_age=60).get("key"))
+
+    def test_put_prunes_expired_scripts(self):
+        cache = _ScriptCache(self.path, max_age=60)
+        cache.put("old", "script")
+        self.now += 61
+        cache.put("new", "script")
+
+        self.assertEqual(self._stored_keys(), ["new"])
+
+    def test_put_keeps_only_newest_entries(self):
+        cache = _ScriptCache(self.path, memory_size=1, max_entries=3)
+        for i in range(5):
+            cache.put(str(i), f"script {i}")
+            self.now += 1
+
+        self.assertEqual(self._stored_keys(), ["2", "3", "4"])
+        self.assertIsNone(cache.get("0"))
+        self.assertEqual(cache.get("2"), "script 2")
+
+    def test_unusable_path_keeps_memory_cache(self):
+        # A file where the cache directory should be makes the SQLite file unavailable
+        with open(os.path.dirname(self.path), "w"):
+            pass
+        cache = _ScriptCache(self.path)
+
+        cache.put("key", "script")
+
+        self.assertEqual(cache.get("key"), "script")
+        self.assertIsNone(_ScriptCache(self.path).get("key"))
+
+
+class BatchGenerateTest(unittest.TestCase):
+    """Tests for GeminiTextGenerator.batch_generate against a fake batch API."""
+
+    def setUp(self):
+        for patcher in (
+            mock.patch.object(gemini_client, "_create_client", lambda api_key: SimpleNamespace(
+                models=SimpleNamespace(get=lambda model: None),
+            )),
+            mock.patch.dict(gemini_client._CLIENT_CACHE, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.generator = GeminiTextGenerator(api_key="test-key")
+
+    def _use_fake_batches(self, polls_until_done):
+        batches = _FakeBatches(polls_until_done)
+        self.generator.client = SimpleNamespace(batches=batches)
+        return batches
+
+    def test_returns_scripts_when_job_finishes(self):
+        self._use_fake_batches(polls_until_done=3)
+
+        scripts = self.generator.batch_generate([{"theme": "rain"}, {"theme": "ocean"}], poll_interval=0, timeout=10)
+
+        self.assertEqual(scripts, ["Speaker1: Hello there."] * 2)
+
+    def test_timeout_cancels_job_and_reports_each_script(self):
+        batches = self._use_fake_batches(polls_until_done=1000000)
+
+        scripts = self.generator.batch_generate([{"theme": "rain"}, {"theme": "ocean"}], poll_interval=0.01, timeout=0.05)
+
+        self.assertEqual(len(scripts), 2)
+        for script in scripts:
+            self.assertTrue(script.startswith("Error: Batch job batches/test did not finish within"), script)
+        self.assertEqual(batches.cancelled, ["batches/test"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,83 +6,171 @@ using PyQt5.
 """
 
 import os
+import platform
+import subprocess
 import sys
+from dataclasses import dataclass
+from typing import Optional
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QLineEdit, QTextEdit, QPushButton, QComboBox, 
                             QSlider, QFileDialog, QMessageBox, QGroupBox, QRadioButton,
                             QSpinBox, QProgressBar)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QRunnable, QStandardPaths, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QIcon
 
-# Import Auto Daddy core functionality
-from auto_daddy import AutoDaddy
+# Application name, which also names the per-user data directory
+APP_NAME = "Auto Daddy"
 
+# Directory of this module, and the output directory next to it used when no per-user
+# data directory is available
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_OUTPUT_DIR = os.path.join(_HERE, "output")
 
-class GenerateAudioThread(QThread):
-    """Thread for generating audio without blocking the UI."""
+# How often (ms) the progress bars advance while a job runs, and how far they may get
+# before the job actually finishes; the API doesn't report real progress
+PROGRESS_TICK_MS = 200
+PROGRESS_STEP = 5
+PROGRESS_MAX_PENDING = 95
+
+# Platform name, looked up once for choosing how to open files
+_SYSTEM = platform.system()
+
+# Voice names are fixed for a given backend version, so they are fetched once per process
+_VOICES_CACHE = None
+
+
+def _get_voices(auto_daddy):
+    """
+    Get the available voice names, asking the backend only the first time.
+    
+    Args:
+        auto_daddy: Instance of the AutoDaddy backend.
+        
+    Returns:
+        tuple: Available voice names
+    """
+    global _VOICES_CACHE
+    if _VOICES_CACHE is None:
+        _VOICES_CACHE = tuple(auto_daddy.get_available_voices())
+    return _VOICES_CACHE
+
+
+def _open_path(path):
+    """
+    Open a file or directory with the platform's default application.
+    
+    Args:
+        path (str): File or directory to open
+    """
+    if _SYSTEM == "Windows":
+        os.startfile(path)
+        return
+    
+    command = "open" if _SYSTEM == "Darwin" else "xdg-open"  # macOS / Linux
+    # Don't wait for the opener to exit, it can take a while to resolve the handler
+    subprocess.Popen(
+        [command, path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+class WorkerSignals(QObject):
+    """Signals for the generation runnables, since QRunnable is not a QObject."""
     finished = pyqtSignal(str)
-    progress = pyqtSignal(int)
+
+
+@dataclass
+class AudioJob:
+    """Parameters for one audio generation."""
+    script: str
+    output_filename: Optional[str]  # None generates a timestamped name
+    speaker1_voice: str
+    speaker2_voice: str
+    tts_model_name: str
+    instructive_prefix: str
+
+
+class BackendSignals(QObject):
+    """Signals for InitBackendRunnable."""
+    ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class InitBackendRunnable(QRunnable):
+    """Runnable for creating the Auto Daddy backend without blocking the UI."""
+    
+    def __init__(self, api_key, output_dir):
+        """
+        Initialize the backend creation job.
+
+        Args:
+            api_key (str): Google Gemini API key.
+            output_dir (str): Directory to save output files.
+        """
+        super().__init__()
+        self.signals = BackendSignals()
+        self.api_key = api_key
+        self.output_dir = output_dir
     
-    def __init__(self, auto_daddy, script, output_filename, speaker1_voice, speaker2_voice, tts_model_name, instructive_prefix):
+    def run(self):
+        # The core is imported here rather than at module load, so the google.genai import
+        # it pulls in is paid on a pool thread instead of delaying the window
+        try:
+            from auto_daddy import AutoDaddy
+            auto_daddy = AutoDaddy(api_key=self.api_key, output_dir=self.output_dir)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.ready.emit(auto_daddy)
+
+
+class GenerateAudioRunnable(QRunnable):
+    """Runnable for generating audio on the shared thread pool without blocking the UI."""
+    
+    def __init__(self, auto_daddy, job, signals):
         """
-        Initialize the audio generation thread.
+        Initialize the audio generation job.
 
         Args:
             auto_daddy: Instance of the AutoDaddy backend.
-            script (str): The script text to synthesize.
-            output_filename (str): Path to save the output audio file.
-            speaker1_voice (str): Voice for Speaker 1.
-            speaker2_voice (str): Voice for Speaker 2.
-            tts_model_name (str): Name of the TTS model to use.
-            instructive_prefix (str): Text to prepend to the script to guide TTS model tone.
+            job (AudioJob): What to synthesize and how.
+            signals (WorkerSignals): Signals to report the result through, shared between jobs.
         """
         super().__init__()
+        self.signals = signals
         self.auto_daddy = auto_daddy
-        self.script = script
-        self.output_filename = output_filename
-        self.speaker1_voice = speaker1_voice
-        self.speaker2_voice = speaker2_voice
-        self.tts_model_name = tts_model_name
-        self.instructive_prefix = instructive_prefix
+        self.job = job
     
     def run(self):
-        # Simulate progress updates (since the actual API doesn't provide progress)
-        for i in range(10):
-            self.progress.emit(i * 10)
-            self.msleep(200)  # Sleep for 200ms
-            
         # Generate the audio
+        job = self.job
         result = self.auto_daddy.generate_audio(
-            script=self.script,
-            output_filename=self.output_filename,
-            speaker1_voice=self.speaker1_voice,
-            speaker2_voice=self.speaker2_voice,
-            tts_model_name=self.tts_model_name,
-            instructive_prefix=self.instructive_prefix
+            script=job.script,
+            output_filename=job.output_filename,
+            speaker1_voice=job.speaker1_voice,
+            speaker2_voice=job.speaker2_voice,
+            tts_model_name=job.tts_model_name,
+            instructive_prefix=job.instructive_prefix
         )
         
-        self.progress.emit(100)  # Complete the progress
-        self.finished.emit(result)
+        self.signals.finished.emit(result)
 
 
-class GenerateScriptThread(QThread):
-    """Thread for generating script without blocking the UI."""
-    finished = pyqtSignal(str)
-    progress = pyqtSignal(int)
+class GenerateScriptRunnable(QRunnable):
+    """Runnable for generating a script on the shared thread pool without blocking the UI."""
     
-    def __init__(self, auto_daddy, theme, length, custom_prompt):
+    def __init__(self, auto_daddy, theme, length, custom_prompt, signals):
         super().__init__()
+        self.signals = signals
         self.auto_daddy = auto_daddy
         self.theme = theme
         self.length = length
         self.custom_prompt = custom_prompt
     
     def run(self):
-        # Simulate progress updates (since the actual API doesn't provide progress)
-        for i in range(10):
-            self.progress.emit(i * 10)
-            self.msleep(200)  # Sleep for 200ms
-            
         # Generate the script
         result = self.auto_daddy.generate_script(
             theme=self.theme,
@@ -90,24 +178,37 @@ class GenerateScriptThread(QThread):
             custom_prompt=self.custom_prompt
         )
         
-        self.progress.emit(100)  # Complete the progress
-        self.finished.emit(result)
+        self.signals.finished.emit(result)
 
 
 class AutoDaddyUI(QMainWindow):
     """Main window for the Auto Daddy application."""
     
+    # Fonts shared by every window. QFont can't be built before the QApplication exists,
+    # so they are created by the first window rather than at import.
+    _title_font = None
+    _desc_font = None
+    
     def __init__(self):
         super().__init__()
         
-        # Initialize Auto Daddy backend
-        self.initialize_backend()
+        # Generation jobs run on Qt's shared pool, so worker threads are reused between clicks
+        self._pool = QThreadPool.globalInstance()
+        self.auto_daddy = None
+        
+        # Every job reports through the same signal objects, connected once here. Results
+        # always come from pool threads, so the connections are queued explicitly.
+        self._script_signals = WorkerSignals()
+        self._script_signals.finished.connect(self.on_script_generated, Qt.QueuedConnection)
+        self._audio_signals = WorkerSignals()
+        self._audio_signals.finished.connect(self.on_audio_generated, Qt.QueuedConnection)
         
-        # Set up the UI
+        # Set up the UI, then create the backend in the background so the window appears at once
         self.init_ui()
+        self.initialize_backend()
     
     def initialize_backend(self):
-        """Initialize the Auto Daddy backend."""
+        """Start initializing the Auto Daddy backend on a pool thread."""
         # Try to get API key from environment
         self.api_key = os.environ.get("GEMINI_API_KEY")
         
@@ -115,16 +216,35 @@ class AutoDaddyUI(QMainWindow):
         if not self.api_key:
             self.api_key = self.prompt_for_api_key()
         
-        # Set up output directory
-        self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "output")
+        # Set up output directory in the per-user data directory, which is local and writable
+        # even when the app is installed somewhere read-only or on a slow network share
+        app_data_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        self.output_dir = os.path.join(app_data_dir, "output") if app_data_dir else _DEFAULT_OUTPUT_DIR
         os.makedirs(self.output_dir, exist_ok=True)
         
         # Initialize Auto Daddy
-        try:
-            self.auto_daddy = AutoDaddy(api_key=self.api_key, output_dir=self.output_dir)
-        except Exception as e:
-            QMessageBox.critical(self, "Initialization Error", f"Failed to initialize Auto Daddy: {str(e)}")
-            sys.exit(1)
+        runnable = InitBackendRunnable(self.api_key, self.output_dir)
+        runnable.signals.ready.connect(self.on_backend_ready, Qt.QueuedConnection)
+        runnable.signals.failed.connect(self.on_backend_failed, Qt.QueuedConnection)
+        self._pool.start(runnable)
+    
+    def on_backend_ready(self, auto_daddy):
+        """Handle the initialized backend."""
+        self.auto_daddy = auto_daddy
+        
+        voices = _get_voices(auto_daddy)
+        self.speaker1_voice_combo.addItems(voices)
+        self.speaker2_voice_combo.addItems(voices)
+        
+        self.generate_script_btn.setEnabled(True)
+        self.generate_audio_btn.setEnabled(True)
+        self.save_script_btn.setEnabled(True)
+        self.statusBar().showMessage("Ready")
+    
+    def on_backend_failed(self, error):
+        """Handle a backend initialization failure."""
+        QMessageBox.critical(self, "Initialization Error", f"Failed to initialize Auto Daddy: {error}")
+        QApplication.instance().exit(1)
     
     def prompt_for_api_key(self):
         """Prompt the user for a Gemini API key."""
@@ -154,13 +274,20 @@ class AutoDaddyUI(QMainWindow):
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         
+        # Hold off repaints while the widgets are built, so layout is settled in a single pass
+        central_widget.setUpdatesEnabled(False)
+        
         # Add title and description
+        if AutoDaddyUI._title_font is None:
+            AutoDaddyUI._title_font = QFont("Arial", 18, QFont.Bold)
+            AutoDaddyUI._desc_font = QFont("Arial", 12)
+        
         title_label = QLabel("Auto Daddy")
-        title_label.setFont(QFont("Arial", 18, QFont.Bold))
+        title_label.setFont(self._title_font)
         title_label.setAlignment(Qt.AlignCenter)
         
         desc_label = QLabel("Generate ASMR daddy audio content with AI")
-        desc_label.setFont(QFont("Arial", 12))
+        desc_label.setFont(self._desc_font)
         desc_label.setAlignment(Qt.AlignCenter)
         
         main_layout.addWidget(title_label)
@@ -206,7 +333,8 @@ class AutoDaddyUI(QMainWindow):
         
         generate_btn_layout = QHBoxLayout()
         self.generate_script_btn = QPushButton("Generate Script")
-        self.generate_script_btn.clicked.connect(self.generate_script)
+        # Queued, so a double-click reaches the slot only after the first click has disabled the button
+        self.generate_script_btn.clicked.connect(self.generate_script, Qt.QueuedConnection)
         generate_btn_layout.addStretch()
         generate_btn_layout.addWidget(self.generate_script_btn)
         ai_options_layout.addLayout(generate_btn_layout)
@@ -231,6 +359,7 @@ class AutoDaddyUI(QMainWindow):
         self.script_progress = QProgressBar()
         self.script_progress.setVisible(False)
         script_layout.addWidget(self.script_progress)
+        self._script_timer = self._create_progress_timer(self.script_progress)
         
         script_group.setLayout(script_layout)
         main_layout.addWidget(script_group)
@@ -260,7 +389,6 @@ class AutoDaddyUI(QMainWindow):
         speaker1_voice_layout = QHBoxLayout()
         speaker1_voice_layout.addWidget(QLabel("Speaker 1 Voice:"))
         self.speaker1_voice_combo = QComboBox()
-        self.speaker1_voice_combo.addItems(self.auto_daddy.get_available_voices())
         speaker1_voice_layout.addWidget(self.speaker1_voice_combo)
         audio_layout.addLayout(speaker1_voice_layout)
         
@@ -268,14 +396,13 @@ class AutoDaddyUI(QMainWindow):
         speaker2_voice_layout = QHBoxLayout()
         speaker2_voice_layout.addWidget(QLabel("Speaker 2 Voice:"))
         self.speaker2_voice_combo = QComboBox()
-        self.speaker2_voice_combo.addItems(self.auto_daddy.get_available_voices())
         speaker2_voice_layout.addWidget(self.speaker2_voice_combo)
         audio_layout.addLayout(speaker2_voice_layout)
         
         # Generate audio button
         audio_btn_layout = QHBoxLayout()
         self.generate_audio_btn = QPushButton("Generate Audio")
-        self.generate_audio_btn.clicked.connect(self.generate_audio)
+        self.generate_audio_btn.clicked.connect(self.generate_audio, Qt.QueuedConnection)
         audio_btn_layout.addStretch()
         audio_btn_layout.addWidget(self.generate_audio_btn)
         audio_layout.addLayout(audio_btn_layout)
@@ -284,6 +411,7 @@ class AutoDaddyUI(QMainWindow):
         self.audio_progress = QProgressBar()
         self.audio_progress.setVisible(False)
         audio_layout.addWidget(self.audio_progress)
+        self._audio_timer = self._create_progress_timer(self.audio_progress)
         
         # Audio output info
         self.audio_output_label = QLabel("Audio output will appear here")
@@ -308,8 +436,32 @@ class AutoDaddyUI(QMainWindow):
         file_group.setLayout(file_layout)
         main_layout.addWidget(file_group)
         
+        # Generation needs the backend, which is enabled once it has initialized
+        self.generate_script_btn.setEnabled(False)
+        self.generate_audio_btn.setEnabled(False)
+        self.save_script_btn.setEnabled(False)
+        
         # Status bar
-        self.statusBar().showMessage("Ready")
+        self.statusBar().showMessage("Initializing...")
+        
+        central_widget.setUpdatesEnabled(True)
+    
+    def _create_progress_timer(self, progress_bar):
+        """
+        Create a UI-thread timer that advances a progress bar while a job runs.
+        
+        Args:
+            progress_bar (QProgressBar): Progress bar to advance
+            
+        Returns:
+            QTimer: Stopped timer; start it when the job starts and stop it when it finishes
+        """
+        timer = QTimer(self)
+        timer.setInterval(PROGRESS_TICK_MS)
+        timer.timeout.connect(
+            lambda: progress_bar.setValue(min(progress_bar.value() + PROGRESS_STEP, PROGRESS_MAX_PENDING))
+        )
+        return timer
     
     def toggle_script_input_method(self):
         """Toggle between manual and AI script input methods."""
@@ -325,12 +477,16 @@ class AutoDaddyUI(QMainWindow):
     
     def generate_script(self):
         """Generate a script using the AI."""
-        if not self.ai_radio.isChecked():
+        # Ignore clicks that were queued while a generation was already running
+        if not self.ai_radio.isChecked() or not self.generate_script_btn.isEnabled():
             return
         
-        theme = self.theme_input.text().strip()
-        if not theme:
-            QMessageBox.warning(self, "Input Required", "Please enter a theme for the script.")
+        # Disable the button before validating: the warning dialog runs a nested event loop,
+        # which would otherwise deliver the next queued click while the button looks idle
+        self.generate_script_btn.setEnabled(False)
+        theme = self._require_text(self.theme_input.text(), "Input Required", "Please enter a theme for the script.")
+        if theme is None:
+            self.generate_script_btn.setEnabled(True)
             return
         
         length = self.length_combo.currentText().lower()
@@ -338,38 +494,39 @@ class AutoDaddyUI(QMainWindow):
         # Show progress bar
         self.script_progress.setValue(0)
         self.script_progress.setVisible(True)
-        self.generate_script_btn.setEnabled(False)
+        self._script_timer.start()
         self.statusBar().showMessage("Generating script...")
         
-        # Generate script in a separate thread
-        self.script_thread = GenerateScriptThread(
+        # Generate script on a pool thread
+        self._pool.start(GenerateScriptRunnable(
             self.auto_daddy,
             theme,
             length,
-            None  # No custom prompt
-        )
-        self.script_thread.progress.connect(self.script_progress.setValue)
-        self.script_thread.finished.connect(self.on_script_generated)
-        self.script_thread.start()
+            None,  # No custom prompt
+            self._script_signals
+        ))
     
     def on_script_generated(self, script):
         """Handle generated script."""
-        self.script_text.setText(script)
+        self.script_text.setPlainText(script)
+        self._script_timer.stop()
+        self.script_progress.setValue(100)
         self.script_progress.setVisible(False)
         self.generate_script_btn.setEnabled(True)
         self.statusBar().showMessage("Script generated successfully")
     
     def generate_audio(self):
         """Generate audio from the current script."""
-        script = self.script_text.toPlainText().strip()
-        if not script:
-            QMessageBox.warning(self, "Script Required", "Please generate or enter a script first.")
+        # Ignore clicks that were queued while a generation was already running
+        if not self.generate_audio_btn.isEnabled():
             return
         
-        # If manual input, format the script
-        if self.manual_radio.isChecked():
-            script = self.auto_daddy.set_manual_script(script)
-            self.script_text.setText(script)  # Update with formatted script
+        # Disabled before validating, for the same reason as in generate_script
+        self.generate_audio_btn.setEnabled(False)
+        script = self._require_text(self.script_text.toPlainText(), "Script Required", "Please generate or enter a script first.")
+        if script is None:
+            self.generate_audio_btn.setEnabled(True)
+            return
         
         tts_model = self.model_combo.currentText()
         s1_voice = self.speaker1_voice_combo.currentText()
@@ -379,25 +536,24 @@ class AutoDaddyUI(QMainWindow):
         # Show progress bar
         self.audio_progress.setValue(0)
         self.audio_progress.setVisible(True)
-        self.generate_audio_btn.setEnabled(False)
+        self._audio_timer.start()
         self.statusBar().showMessage("Generating audio...")
         
-        # Generate audio in a separate thread
-        self.audio_thread = GenerateAudioThread(
-            self.auto_daddy,
-            script,
-            None,  # Use default filename
+        # Generate audio on a pool thread
+        job = AudioJob(
+            script=script,
+            output_filename=None,  # Use default filename
             speaker1_voice=s1_voice,
             speaker2_voice=s2_voice,
             tts_model_name=tts_model,
             instructive_prefix=instructive_prefix
         )
-        self.audio_thread.progress.connect(self.audio_progress.setValue)
-        self.audio_thread.finished.connect(self.on_audio_generated)
-        self.audio_thread.start()
+        self._pool.start(GenerateAudioRunnable(self.auto_daddy, job, self._audio_signals))
     
     def on_audio_generated(self, result):
         """Handle generated audio."""
+        self._audio_timer.stop()
+        self.audio_progress.setValue(100)
         self.audio_progress.setVisible(False)
         self.generate_audio_btn.setEnabled(True)
         
@@ -408,33 +564,33 @@ class AutoDaddyUI(QMainWindow):
             self.audio_output_label.setText(f"Audio saved to: {result}")
             self.statusBar().showMessage("Audio generated successfully")
             
-            # Ask if user wants to open the audio file
-            reply = QMessageBox.question(
-                self, 
-                "Audio Generated", 
+            # Ask if user wants to open the audio file. open() shows the box without blocking
+            # the event loop, so queued jobs keep finishing while it is up.
+            box = QMessageBox(
+                QMessageBox.Question,
+                "Audio Generated",
                 f"Audio file saved to:\n{result}\n\nWould you like to open it?",
                 QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.Yes
+                self
             )
+            box.setDefaultButton(QMessageBox.Yes)
+            box.setAttribute(Qt.WA_DeleteOnClose)
             
-            if reply == QMessageBox.Yes:
-                self.open_file(result)
+            def on_reply(reply, file_path=result):
+                if reply == QMessageBox.Yes:
+                    self.open_file(file_path)
+            
+            box.finished.connect(on_reply)
+            box.open()
     
     def save_script(self):
         """Save the current script to a file."""
-        script = self.script_text.toPlainText().strip()
-        if not script:
-            QMessageBox.warning(self, "Empty Script", "There is no script to save.")
+        script = self._require_text(self.script_text.toPlainText(), "Empty Script", "There is no script to save.")
+        if script is None:
             return
         
-        # Set the script in Auto Daddy
-        if self.manual_radio.isChecked():
-            self.auto_daddy.set_manual_script(script)
-        else:
-            self.auto_daddy.current_script = script
-        
         # Save the script
-        result = self.auto_daddy.save_script()
+        result = self.auto_daddy.save_script(script)
         
         if result.startswith("Error"):
             QMessageBox.critical(self, "Save Error", result)
@@ -442,35 +598,36 @@ class AutoDaddyUI(QMainWindow):
             self.statusBar().showMessage(f"Script saved to: {result}")
             QMessageBox.information(self, "Script Saved", f"Script saved to:\n{result}")
     
+    def _require_text(self, text, title, message):
+        """
+        Strip user input, warning the user if nothing is left.
+        
+        Args:
+            text (str): Text taken from an input widget
+            title (str): Title of the warning dialog
+            message (str): Message shown when the text is empty
+            
+        Returns:
+            str: The stripped text, or None if it was empty
+        """
+        text = text.strip()
+        if not text:
+            QMessageBox.warning(self, title, message)
+            return None
+        return text
+    
     def open_output_dir(self):
         """Open the output directory in the file explorer."""
-        import subprocess
-        import platform
-        
         try:
-            if platform.system() == "Windows":
-                os.startfile(self.output_dir)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.call(["open", self.output_dir])
-            else:  # Linux
-                subprocess.call(["xdg-open", self.output_dir])
-                
+            _open_path(self.output_dir)
             self.statusBar().showMessage(f"Opened output directory: {self.output_dir}")
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open output directory: {str(e)}")
     
     def open_file(self, file_path):
         """Open a file with the default application."""
-        import subprocess
-        import platform
-        
         try:
-            if platform.system() == "Windows":
-                os.startfile(file_path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.call(["open", file_path])
-            else:  # Linux
-                subprocess.call(["xdg-open", file_path])
+            _open_path(file_path)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not open file: {str(e)}")
 
@@ -478,6 +635,7 @@ class AutoDaddyUI(QMainWindow):
 def main():
     """Main entry point for the application."""
     app = QApplication(sys.argv)
+    app.setApplicationName(APP_NAME)
     window = AutoDaddyUI()
     window.show()
     sys.exit(app.exec_())